@@ -8,7 +8,11 @@ for the Yuga Planner scheduling system, organized into:
 """
 
 # Import from data submodule
-from .data.formatters import schedule_to_dataframe, employees_to_dataframe
+from .data.formatters import (
+    schedule_to_dataframe,
+    tasks_to_dataframe,
+    employees_to_dataframe,
+)
 from .data.generators import (
     generate_employees,
     generate_employee_availability,
@@ -22,6 +26,7 @@ from .agents.task_composer_agent import TaskComposerAgent
 __all__ = [
     # Data formatters - convert domain objects to DataFrames
     "schedule_to_dataframe",
+    "tasks_to_dataframe",
     "employees_to_dataframe",
     # Data generators - create domain objects
     "generate_employees",
@@ -5,7 +5,11 @@ This module contains all algorithmic data creation, generation, and formatting l
 for the Yuga Planner scheduling system.
 """
 
-from .formatters import schedule_to_dataframe, employees_to_dataframe
+from .formatters import (
+    schedule_to_dataframe,
+    tasks_to_dataframe,
+    employees_to_dataframe,
+)
 from .generators import (
     generate_employees,
     generate_employee_availability,
@@ -16,6 +20,7 @@ from .provider import generate_agent_data, generate_mcp_data
 __all__ = [
     # Data formatters - convert domain objects to DataFrames
     "schedule_to_dataframe",
+    "tasks_to_dataframe",
     "employees_to_dataframe",
     # Data generators - create domain objects
     "generate_employees",
@@ -19,7 +19,20 @@ def schedule_to_dataframe(schedule) -> pd.DataFrame:
     Returns:
         pd.DataFrame: The converted DataFrame.
     """
-    data: list[dict[str, str]] = []
+    columns: dict[str, list] = {
+        "Project": [],
+        "Sequence": [],
+        "Employee": [],
+        "Task": [],
+        "Start": [],
+        "End": [],
+        "Duration (hours)": [],
+        "Required Skill": [],
+        "Pinned": [],
+        "Unavailable": [],
+        "Undesired": [],
+        "Desired": [],
+    }
 
     # Get base date from schedule info if available
     base_date = None
@@ -37,35 +50,78 @@ def schedule_to_dataframe(schedule) -> pd.DataFrame:
         end_time: datetime = slot_to_datetime(
             task.start_slot + task.duration_slots, base_date
         )
+        start_date: date = start_time.date()
+        assigned: bool = employee != "Unassigned"
+
+        columns["Project"].append(getattr(task, "project_id", ""))
+        columns["Sequence"].append(getattr(task, "sequence_number", 0))
+        columns["Employee"].append(employee)
+        columns["Task"].append(task.description)
+        columns["Start"].append(start_time)
+        columns["End"].append(end_time)
+        columns["Duration (hours)"].append(
+            task.duration_slots / 2
+        )  # Convert slots to hours
+        columns["Required Skill"].append(task.required_skill)
+        columns["Pinned"].append(getattr(task, "pinned", False))
+
+        # Check if task falls on employee's unavailable, undesired or desired date
+        columns["Unavailable"].append(
+            assigned
+            and hasattr(task.employee, "unavailable_dates")
+            and start_date in task.employee.unavailable_dates
+        )
+        columns["Undesired"].append(
+            assigned
+            and hasattr(task.employee, "undesired_dates")
+            and start_date in task.employee.undesired_dates
+        )
+        columns["Desired"].append(
+            assigned
+            and hasattr(task.employee, "desired_dates")
+            and start_date in task.employee.desired_dates
+        )
+
+    return pd.DataFrame(columns, copy=False)
+
+
+def tasks_to_dataframe(tasks) -> pd.DataFrame:
+    """
+    Convert a list of Task objects to a pandas DataFrame of their raw fields.
 
-        # Add task data to list with availability flags
-        data.append(
-            {
-                "Project": getattr(task, "project_id", ""),
-                "Sequence": getattr(task, "sequence_number", 0),
-                "Employee": employee,
-                "Task": task.description,
-                "Start": start_time,
-                "End": end_time,
-                "Duration (hours)": task.duration_slots / 2,  # Convert slots to hours
-                "Required Skill": task.required_skill,
-                "Pinned": getattr(task, "pinned", False),  # Include pinned status
-                # Check if task falls on employee's unavailable date
-                "Unavailable": employee != "Unassigned"
-                and hasattr(task.employee, "unavailable_dates")
-                and start_time.date() in task.employee.unavailable_dates,
-                # Check if task falls on employee's undesired date
-                "Undesired": employee != "Unassigned"
-                and hasattr(task.employee, "undesired_dates")
-                and start_time.date() in task.employee.undesired_dates,
-                # Check if task falls on employee's desired date
-                "Desired": employee != "Unassigned"
-                and hasattr(task.employee, "desired_dates")
-                and start_time.date() in task.employee.desired_dates,
-            }
+    Columns are collected as lists and handed to pandas in one go, which avoids
+    per-row dict construction and dtype inference.
+
+    Args:
+        tasks (list[Task]): The tasks to convert.
+
+    Returns:
+        pd.DataFrame: The converted DataFrame.
+    """
+    columns: dict[str, list] = {
+        "id": [],
+        "description": [],
+        "duration_slots": [],
+        "start_slot": [],
+        "required_skill": [],
+        "sequence_number": [],
+        "employee": [],
+        "project_id": [],
+    }
+
+    for t in tasks:
+        columns["id"].append(t.id)
+        columns["description"].append(t.description)
+        columns["duration_slots"].append(t.duration_slots)
+        columns["start_slot"].append(t.start_slot)
+        columns["required_skill"].append(t.required_skill)
+        columns["sequence_number"].append(t.sequence_number)
+        columns["employee"].append(
+            t.employee.name if hasattr(t.employee, "name") else None
         )
+        columns["project_id"].append(t.project_id)
 
-    return pd.DataFrame(data)
+    return pd.DataFrame(columns, copy=False)
 
 
 def employees_to_dataframe(schedule) -> pd.DataFrame:
@@ -5,7 +5,7 @@ from datetime import date
 from random import Random
 
 pd.set_option("display.max_columns", None)
-from factory.data.formatters import schedule_to_dataframe
+from factory.data.formatters import schedule_to_dataframe, tasks_to_dataframe
 
 from factory.data.generators import *
 from factory.data.models import *
@@ -276,40 +276,10 @@ async def generate_mcp_data(
         t.employee = employees[0]
 
     # Create DataFrames for debugging
-    calendar_df = pd.DataFrame(
-        [
-            {
-                "id": t.id,
-                "description": t.description,
-                "duration_slots": t.duration_slots,
-                "start_slot": t.start_slot,
-                "required_skill": t.required_skill,
-                "sequence_number": t.sequence_number,
-                "employee": t.employee.name if hasattr(t.employee, "name") else None,
-                "project_id": t.project_id,
-            }
-            for t in calendar_tasks
-        ]
-    )
-
+    calendar_df = tasks_to_dataframe(calendar_tasks)
     logger.debug("Generated calendar tasks DataFrame:\n%s", calendar_df)
 
-    llm_df = pd.DataFrame(
-        [
-            {
-                "id": t.id,
-                "description": t.description,
-                "duration_slots": t.duration_slots,
-                "start_slot": t.start_slot,
-                "required_skill": t.required_skill,
-                "sequence_number": t.sequence_number,
-                "employee": t.employee.name if hasattr(t.employee, "name") else None,
-                "project_id": t.project_id,
-            }
-            for t in llm_tasks
-        ]
-    )
-
+    llm_df = tasks_to_dataframe(llm_tasks)
     logger.debug("Generated LLM tasks DataFrame:\n%s", llm_df)
 
     # --- ASSIGN SEQUENCE NUMBERS ---
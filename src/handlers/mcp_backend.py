@@ -123,7 +123,7 @@ async def process_message_and_attached_file(
 
         # Create state data format expected by ScheduleService
         state_data = {
-            "task_df_json": schedule_data.to_json(orient="split"),
+            "task_df": schedule_data,
             "employee_count": 1,
             "days_in_schedule": 365,
         }
@@ -1,11 +1,89 @@
 import json, re, asyncio
-from typing import Dict, List, Any, Optional
+import orjson
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from utils.logging_config import setup_logging, get_logger
 
 # Initialize logging
 setup_logging()
 logger = get_logger(__name__)
 
+# Characters that affect JSON nesting; the regex engine skips everything else
+_STRUCTURAL_CHARS = re.compile(r'[{}"\\]')
+
+# Patterns used while repairing and processing tool call arguments
+_NON_PRINTABLE = re.compile(r"[^\x20-\x7E]")
+_DUPLICATE_OBJECT_START = re.compile(r'"[\s\S]*?\{\s*"task_description"')
+_CALENDAR_DATA_MARKER = re.compile(r"\[CALENDAR_DATA:([^\]]+)\]")
+
+# For ASCII input, everything outside 0x20-0x7E is a control character
+_ASCII_CONTROL_BYTES = bytes([*range(0x20), 0x7F])
+
+
+def _strip_non_printable(text: str) -> str:
+    """Remove every character outside printable ASCII (0x20-0x7E)."""
+    if text.isascii():
+        # Byte-level delete table; the regex is only needed for non-ASCII input
+        cleaned = text.encode("ascii").translate(None, _ASCII_CONTROL_BYTES)
+        return cleaned.decode("ascii")
+
+    return _NON_PRINTABLE.sub("", text)
+
+
+def _object_ends(text: str, start: int = 0) -> Iterator[int]:
+    """
+    Yield each offset just past a '}' that brings brace depth back to zero.
+
+    Only structural characters are visited, so long string payloads such as
+    base64 calendar data are skipped in C. Braces inside string literals,
+    including after escaped quotes, do not count towards the depth.
+    """
+    depth = 0
+    in_string = False
+    escaped = -1
+
+    for match in _STRUCTURAL_CHARS.finditer(text, start):
+        pos = match.start()
+
+        if pos == escaped:
+            continue
+
+        char = match.group()
+
+        if in_string:
+            if char == "\\":
+                escaped = pos + 1
+
+            elif char == '"':
+                in_string = False
+
+        elif char == '"':
+            in_string = True
+
+        elif char == "{":
+            depth += 1
+
+        elif char == "}":
+            depth -= 1
+
+            if depth == 0:
+                yield pos + 1
+
+
+def _is_single_object(text: str) -> bool:
+    """
+    Check that text is one brace-balanced object and nothing else.
+
+    Uses the same structural scan as _object_ends: depth must return to
+    zero exactly once, at the final closing brace. Concatenated duplicate
+    objects and truncated payloads both fail this check.
+    """
+    body = text.strip(" ")
+
+    if not body.startswith("{") or not body.endswith("}"):
+        return False
+
+    return next(_object_ends(body), -1) == len(body)
+
 
 class ToolCallAssembler:
     """Handles streaming tool call assembly from API responses"""
@@ -18,6 +96,10 @@ class ToolCallAssembler:
         """Reset the assembler for a new conversation"""
         self.tool_calls = {}
 
+        # debug_info() detail per tool call, keyed on (id, name, arguments)
+        self._debug_cache: Dict[int, Tuple[Tuple[str, str, str], Dict[str, Any]]] = {}
+        self._debug_completed = 0
+
     def process_delta(self, delta: Dict[str, Any]) -> None:
         """Process a single delta from streaming response"""
         if "tool_calls" not in delta:
@@ -61,10 +143,10 @@ class ToolCallAssembler:
             if tool_call["function"]["name"] and tool_call["function"]["arguments"]:
                 try:
                     # Validate JSON arguments
-                    json.loads(tool_call["function"]["arguments"])
+                    orjson.loads(tool_call["function"]["arguments"])
                     completed.append(tool_call)
 
-                except json.JSONDecodeError as e:
+                except orjson.JSONDecodeError as e:
                     logger.warning(
                         f"Tool call {tool_call['id']} has invalid JSON arguments: {e}"
                     )
@@ -133,7 +215,7 @@ class ToolCallAssembler:
                     try:
                         repaired_args = self._attempt_json_repair(args)
                         if repaired_args:
-                            json.loads(repaired_args)  # Test if repair worked
+                            orjson.loads(repaired_args)  # Test if repair worked
                             logger.info(
                                 f"Successfully repaired JSON for tool call {tool_call['id']}"
                             )
@@ -150,24 +232,29 @@ class ToolCallAssembler:
     def _attempt_json_repair(self, broken_json: str) -> str:
         """Attempt to repair common JSON issues. Only return a string if it is valid JSON. Return None if unrecoverable."""
         try:
-            # 1. Always remove non-printable characters first
-            cleaned = re.sub(r"[^\x20-\x7E]", "", broken_json)
-            broken_json = cleaned
-
-            # 2. Try parsing as-is
-            try:
-                json.loads(broken_json)
-                return broken_json
+            # 1. Always remove non-printable characters first; printable ASCII
+            #    input is already clean, so skip the rebuild
+            if not (broken_json.isascii() and broken_json.isprintable()):
+                broken_json = _strip_non_printable(broken_json)
+
+            # 2. Try parsing as-is, unless a structural scan already shows an
+            #    unbalanced or duplicated root object that cannot parse
+            if not broken_json.lstrip(" ").startswith("{") or _is_single_object(
+                broken_json
+            ):
+                try:
+                    orjson.loads(broken_json)
+                    return broken_json
 
-            except Exception:
-                pass
+                except Exception:
+                    pass
 
             # 3. Add missing closing brace if needed, then try parsing
             if not broken_json.strip().endswith("}"):
                 candidate = broken_json.strip() + "}"
 
                 try:
-                    json.loads(candidate)
+                    orjson.loads(candidate)
                     return candidate
 
                 except Exception:
@@ -181,8 +268,7 @@ class ToolCallAssembler:
                 if start_idx != -1:
                     content_start = start_idx + len(start_pattern)
                     remaining = broken_json[content_start:]
-                    duplicate_pattern = r'"[\s\S]*?\{\s*"task_description"'
-                    match = re.search(duplicate_pattern, remaining)
+                    match = _DUPLICATE_OBJECT_START.search(remaining)
 
                     if match:
                         clean_end_pos = content_start + match.start()
@@ -201,19 +287,7 @@ class ToolCallAssembler:
 
                             # Try to find the proper ending
                             if not clean_rest.endswith("}"):
-                                brace_count = 0
-                                proper_end = -1
-
-                                for i, char in enumerate(clean_rest):
-                                    if char == "{":
-                                        brace_count += 1
-
-                                    elif char == "}":
-                                        brace_count -= 1
-
-                                        if brace_count == 0:
-                                            proper_end = i + 1
-                                            break
+                                proper_end = next(_object_ends(clean_rest), -1)
 
                                 if proper_end != -1:
                                     clean_rest = clean_rest[:proper_end]
@@ -222,7 +296,7 @@ class ToolCallAssembler:
                                     clean_rest = clean_rest.rstrip() + "}"
 
                             try:
-                                rest_obj = json.loads(clean_rest)
+                                rest_obj = orjson.loads(clean_rest)
                                 task_desc = rest_obj.get("task_description", "")
                                 repaired_obj = {
                                     "task_description": task_desc,
@@ -230,7 +304,7 @@ class ToolCallAssembler:
                                 }
 
                                 repaired = json.dumps(repaired_obj)
-                                json.loads(repaired)
+                                orjson.loads(repaired)
 
                                 return repaired
 
@@ -239,7 +313,7 @@ class ToolCallAssembler:
                                 repaired = f'{{"task_description":"","calendar_file_content":"{clean_calendar_data}"}}'
 
                                 try:
-                                    json.loads(repaired)
+                                    orjson.loads(repaired)
                                     return repaired
 
                                 except Exception:
@@ -264,7 +338,7 @@ class ToolCallAssembler:
                                 )
 
                                 try:
-                                    json.loads(repaired)
+                                    orjson.loads(repaired)
                                     return repaired
 
                                 except Exception:
@@ -274,24 +348,15 @@ class ToolCallAssembler:
             first_brace = broken_json.find("{")
 
             if first_brace != -1:
-                brace_count = 0
-
-                for i in range(first_brace, len(broken_json)):
-                    if broken_json[i] == "{":
-                        brace_count += 1
-
-                    elif broken_json[i] == "}":
-                        brace_count -= 1
-
-                        if brace_count == 0:
-                            candidate = broken_json[first_brace : i + 1]
+                for end in _object_ends(broken_json, first_brace):
+                    candidate = broken_json[first_brace:end]
 
-                            try:
-                                json.loads(candidate)
-                                return candidate
+                    try:
+                        orjson.loads(candidate)
+                        return candidate
 
-                            except Exception:
-                                continue
+                    except Exception:
+                        continue
 
             # 6. If all else fails, return None
             return None
@@ -301,35 +366,55 @@ class ToolCallAssembler:
             return None
 
     def debug_info(self) -> Dict[str, Any]:
-        """Get debug information about current tool calls"""
-        info = {
-            "total_tool_calls": len(self.tool_calls),
-            "completed_tool_calls": len(self.get_completed_tool_calls()),
-            "tool_calls_detail": {},
-        }
+        """
+        Get debug information about current tool calls.
+
+        Details are cached per tool call and only rebuilt for calls whose id,
+        name or arguments changed since the previous call, so polling this
+        after every delta does not re-validate unchanged arguments.
+        """
+        details = {}
+        changed = len(self._debug_cache) != len(self.tool_calls)
 
         for index, tool_call in self.tool_calls.items():
-            info["tool_calls_detail"][index] = {
+            arguments = tool_call["function"]["arguments"]
+            key = (tool_call["id"], tool_call["function"]["name"], arguments)
+            cached = self._debug_cache.get(index)
+
+            # Equal strings compare by identity first, so unchanged arguments are cheap
+            if cached is not None and cached[0] == key:
+                details[index] = dict(cached[1])
+                continue
+
+            changed = True
+            detail = {
                 "id": tool_call["id"],
                 "function_name": tool_call["function"]["name"],
-                "arguments_length": len(tool_call["function"]["arguments"]),
-                "arguments_preview": tool_call["function"]["arguments"][:100] + "..."
-                if len(tool_call["function"]["arguments"]) > 100
-                else tool_call["function"]["arguments"],
-                "is_json_valid": self._is_valid_json(
-                    tool_call["function"]["arguments"]
-                ),
+                "arguments_length": len(arguments),
+                "arguments_preview": arguments[:100] + "..."
+                if len(arguments) > 100
+                else arguments,
+                "is_json_valid": self._is_valid_json(arguments),
             }
+            self._debug_cache[index] = (key, detail)
+            details[index] = dict(detail)
+
+        if changed:
+            self._debug_completed = len(self.get_completed_tool_calls())
 
-        return info
+        return {
+            "total_tool_calls": len(self.tool_calls),
+            "completed_tool_calls": self._debug_completed,
+            "tool_calls_detail": details,
+        }
 
     def _is_valid_json(self, json_str: str) -> bool:
         """Check if string is valid JSON"""
         try:
-            json.loads(json_str)
+            orjson.loads(json_str)
             return True
 
-        except:
+        except orjson.JSONDecodeError:
             return False
 
 
@@ -383,7 +468,7 @@ class ToolCallProcessor:
             calendar_content = args.get("calendar_file_content", "none")
 
             # Extract calendar data from message if available (override args)
-            calendar_match = re.search(r"\[CALENDAR_DATA:([^\]]+)\]", message)
+            calendar_match = _CALENDAR_DATA_MARKER.search(message)
 
             if calendar_match:
                 calendar_content = calendar_match.group(1)
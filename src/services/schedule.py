@@ -44,7 +44,8 @@ class ScheduleService:
         Solve a schedule from state data.
 
         Args:
-            state_data: State data containing task information and parameters
+            state_data: State data containing task information ("task_df" DataFrame
+                or "task_df_json" string) and parameters
             job_id: Job identifier for tracking
             debug: Enable debug logging
 
@@ -62,13 +63,17 @@ class ScheduleService:
         else:
             os.environ["YUGA_DEBUG"] = "false"
 
-        # Extract parameters from state data dict
+        # Extract parameters from state data dict. In-process callers can pass the
+        # DataFrame itself as "task_df"; serialized UI state carries "task_df_json".
+        task_df = state_data.get("task_df")
         task_df_json = state_data.get("task_df_json")
         employee_count = state_data.get("employee_count")
         days_in_schedule = state_data.get("days_in_schedule")
 
-        if not task_df_json:
-            logger.warning("❌ No task_df_json provided to solve_schedule_from_state")
+        if task_df is None and not task_df_json:
+            logger.warning(
+                "❌ No task_df or task_df_json provided to solve_schedule_from_state"
+            )
 
             return (
                 gr.update(),
@@ -79,8 +84,9 @@ class ScheduleService:
             )
 
         try:
-            # Parse task data
-            task_df = DataService.parse_task_data_from_json(task_df_json, debug)
+            # Parse task data unless the DataFrame was handed over directly
+            if task_df is None:
+                task_df = DataService.parse_task_data_from_json(task_df_json, debug)
 
             # Extract base_date from pinned tasks for consistent slot calculations
             base_date = None
@@ -1,4 +1,6 @@
-from typing import Optional
+import asyncio
+import threading
+from typing import Dict, List, Optional, Tuple
 
 from state import app_state
 
@@ -10,6 +12,11 @@ from utils.logging_config import setup_logging, get_logger
 setup_logging()
 logger = get_logger(__name__)
 
+# Coroutines waiting for a job's next solution, as (loop, event) pairs.
+# Solutions are stored from solver threads, so events are set via their loop.
+_solution_waiters: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+_solution_waiters_lock = threading.Lock()
+
 
 class StateService:
     """Service for managing application state operations"""
@@ -28,6 +35,72 @@ class StateService:
         logger.debug(f"Storing schedule for job_id: {job_id}")
         app_state.add_solved_schedule(job_id, schedule)
 
+        with _solution_waiters_lock:
+            waiters = _solution_waiters.pop(job_id, [])
+
+        for loop, event in waiters:
+            # The waiting loop may have shut down; don't raise in the solver thread
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(event.set)
+
+    @staticmethod
+    async def wait_for_solved_schedule(
+        job_id: str, timeout: float, until_feasible: bool = False
+    ) -> Optional[EmployeeSchedule]:
+        """
+        Wait until a solved schedule is stored for the given job ID.
+
+        The solver stores every new best solution, and the first one is usually
+        the construction heuristic's. With until_feasible, keep waiting on later
+        stores until one satisfies all hard constraints.
+
+        Args:
+            job_id: Job identifier to wait for
+            timeout: Maximum number of seconds to wait
+            until_feasible: Only return early for a schedule with no hard
+                constraint violations
+
+        Returns:
+            The latest stored schedule, or None if none was stored before the timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        while True:
+            event = asyncio.Event()
+            waiter = (loop, event)
+
+            # Register before checking so a concurrent store cannot be missed
+            with _solution_waiters_lock:
+                _solution_waiters.setdefault(job_id, []).append(waiter)
+
+            try:
+                schedule = app_state.get_solved_schedule(job_id)
+
+                if schedule is not None and (
+                    not until_feasible or StateService._is_feasible(schedule)
+                ):
+                    return schedule
+
+                await asyncio.wait_for(event.wait(), timeout=deadline - loop.time())
+
+            except asyncio.TimeoutError:
+                logger.debug(f"Timed out waiting for schedule for job_id: {job_id}")
+                return app_state.get_solved_schedule(job_id)
+
+            finally:
+                with _solution_waiters_lock:
+                    waiters = _solution_waiters.get(job_id, [])
+                    if waiter in waiters:
+                        waiters.remove(waiter)
+                    if not waiters:
+                        _solution_waiters.pop(job_id, None)
+
+    @staticmethod
+    def _is_feasible(schedule: EmployeeSchedule) -> bool:
+        """Check that a schedule has been scored with no hard constraint violations."""
+        return schedule.score is not None and schedule.score.hard_score >= 0
+
     @staticmethod
     def has_solved_schedule(job_id: str) -> bool:
         """
@@ -52,9 +125,21 @@ class StateService:
         Returns:
             The solved schedule if it exists, None otherwise
         """
-        if app_state.has_solved_schedule(job_id):
-            return app_state.get_solved_schedule(job_id)
-        return None
+        return app_state.get_solved_schedule(job_id)
+
+    @staticmethod
+    def pop_solved_schedule(job_id: str) -> Optional[EmployeeSchedule]:
+        """
+        Retrieve and remove a solved schedule by job ID in a single lookup.
+
+        Args:
+            job_id: Job identifier to retrieve
+
+        Returns:
+            The solved schedule if it existed, None otherwise
+        """
+        logger.debug(f"Popping schedule for job_id: {job_id}")
+        return app_state.pop_solved_schedule(job_id)
 
     @staticmethod
     def clear_schedule(job_id: str) -> None:
@@ -65,11 +150,7 @@ class StateService:
             job_id: Job identifier to clear
         """
         logger.debug(f"Clearing schedule for job_id: {job_id}")
-        # Note: app_state doesn't have a clear method, but we can implement if needed
-        # For now, we'll log the request
-        logger.warning(
-            f"Clear schedule requested for {job_id} but not implemented in app_state"
-        )
+        app_state.pop_solved_schedule(job_id)
 
     @staticmethod
     def get_all_job_ids() -> list:
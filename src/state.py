@@ -21,6 +21,10 @@ class AppState:
         """Get a specific solved schedule by key."""
         return self._solved_schedules.get(key)
 
+    def pop_solved_schedule(self, key: str) -> EmployeeSchedule | None:
+        """Remove and return a specific solved schedule by key."""
+        return self._solved_schedules.pop(key, None)
+
     def clear_solved_schedules(self) -> None:
         """Clear all solved schedules."""
         self._solved_schedules.clear()
@@ -1,5 +1,6 @@
 import os, json, re, traceback, asyncio
 import gradio as gr
+import orjson
 
 from typing import Generator
 from datetime import datetime, date
@@ -57,8 +58,33 @@ class DateTimeEncoder(json.JSONEncoder):
             return str(obj)
 
 
+# orjson encodes datetimes natively; dataclasses go through the encoder's default
+# so they are rendered as before, and non-string keys are stringified like json.dumps
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+_json_default = DateTimeEncoder().default
+
+
 def safe_json_dumps(obj, **kwargs):
-    """Safely serialize objects to JSON, handling datetime and other non-serializable types"""
+    """
+    Safely serialize objects to JSON, handling datetime and other non-serializable types.
+
+    Compact and indent=2 output comes from orjson, so it differs from
+    json.dumps: no spaces after separators, non-ASCII characters emitted as
+    UTF-8 rather than escaped, NaN and Infinity written as null, and enum
+    members written by value. Any other keyword arguments use json.dumps.
+    """
+    indent = kwargs.get("indent")
+
+    # orjson only supports compact or 2-space output; anything else uses json.dumps
+    if kwargs.keys() <= {"indent"} and indent in (None, 2):
+        option = _ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if indent else 0)
+
+        try:
+            return orjson.dumps(obj, default=_json_default, option=option).decode()
+
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; let the stdlib encoder try
+
     try:
         return json.dumps(obj, cls=DateTimeEncoder, **kwargs)
     except Exception as e:
@@ -7,7 +7,7 @@ and markdown analysis utilities.
 
 from .logging_config import setup_logging, get_logger, is_debug_enabled
 from .load_secrets import load_secrets
-from .extract_calendar import extract_ical_entries
+from .extract_calendar import extract_ical_entries, extract_ical_entries_stream
 from .markdown_analyzer import MarkdownAnalyzer
 
 __all__ = [
@@ -19,6 +19,7 @@ __all__ = [
     "load_secrets",
     # Calendar utilities
     "extract_ical_entries",
+    "extract_ical_entries_stream",
     # Markdown utilities
     "MarkdownAnalyzer",
 ]
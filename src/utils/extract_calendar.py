@@ -7,6 +7,56 @@ from constraint_solvers.timetable.working_hours import (
 )
 
 
+def _to_iso(val):
+    if hasattr(val, "dt"):
+        dt = val.dt
+
+        if hasattr(dt, "isoformat"):
+            return dt.isoformat()
+
+        return str(dt)
+
+    return str(val)
+
+
+def _to_datetime(val):
+    """Convert icalendar datetime to Python datetime object, keeping original timezone."""
+    if hasattr(val, "dt"):
+        dt = val.dt
+        if isinstance(dt, datetime):
+            # Keep timezone-aware datetimes as-is, or return naive ones unchanged
+            return dt
+        elif isinstance(dt, date):
+            # Convert date to datetime at 9 AM (naive)
+            return datetime.combine(dt, datetime.min.time().replace(hour=9))
+    return None
+
+
+def _event_to_entry(component) -> Dict[str, Any]:
+    """Convert a VEVENT component into a calendar entry dictionary."""
+    summary = str(component.get("summary", ""))
+    dtstart = component.get("dtstart", "")
+    dtend = component.get("dtend", "")
+
+    # Parse datetime objects for slot calculation (keeping original timezone)
+    start_datetime = _to_datetime(dtstart)
+    end_datetime = _to_datetime(dtend)
+
+    entry = {
+        "summary": summary,
+        "dtstart": _to_iso(dtstart),
+        "dtend": _to_iso(dtend),
+    }
+
+    # Add datetime objects for slot calculation
+    if start_datetime:
+        entry["start_datetime"] = start_datetime
+    if end_datetime:
+        entry["end_datetime"] = end_datetime
+
+    return entry
+
+
 def extract_ical_entries(file_bytes):
     try:
         cal = Calendar.from_ical(file_bytes)
@@ -14,52 +64,81 @@ def extract_ical_entries(file_bytes):
 
         for component in cal.walk():
             if component.name == "VEVENT":
-                summary = str(component.get("summary", ""))
-                dtstart = component.get("dtstart", "")
-                dtend = component.get("dtend", "")
-
-                def to_iso(val):
-                    if hasattr(val, "dt"):
-                        dt = val.dt
-
-                        if hasattr(dt, "isoformat"):
-                            return dt.isoformat()
-
-                        return str(dt)
-
-                    return str(val)
-
-                def to_datetime(val):
-                    """Convert icalendar datetime to Python datetime object, keeping original timezone."""
-                    if hasattr(val, "dt"):
-                        dt = val.dt
-                        if isinstance(dt, datetime):
-                            # Keep timezone-aware datetimes as-is, or return naive ones unchanged
-                            return dt
-                        elif isinstance(dt, date):
-                            # Convert date to datetime at 9 AM (naive)
-                            return datetime.combine(
-                                dt, datetime.min.time().replace(hour=9)
-                            )
-                    return None
-
-                # Parse datetime objects for slot calculation (keeping original timezone)
-                start_datetime = to_datetime(dtstart)
-                end_datetime = to_datetime(dtend)
-
-                entry = {
-                    "summary": summary,
-                    "dtstart": to_iso(dtstart),
-                    "dtend": to_iso(dtend),
-                }
-
-                # Add datetime objects for slot calculation
-                if start_datetime:
-                    entry["start_datetime"] = start_datetime
-                if end_datetime:
-                    entry["end_datetime"] = end_datetime
-
-                entries.append(entry)
+                entries.append(_event_to_entry(component))
+
+        return entries, None
+
+    except Exception as e:
+        return None, str(e)
+
+
+def extract_ical_entries_stream(fileobj, chunk_size: int = 4096):
+    """
+    Extract calendar entries from a binary file object without buffering the whole file.
+
+    The calendar header (properties and VTIMEZONE blocks) is parsed once, when the
+    first VEVENT starts, which also registers its timezones with icalendar. Each
+    VEVENT is then parsed on its own as soon as its END line is read, so peak memory
+    is bounded by the header plus one event rather than by the file size.
+
+    Args:
+        fileobj: Binary file-like object opened on an .ics file
+        chunk_size: Number of bytes to read per call
+
+    Returns:
+        Tuple of (entries, error) with the same semantics as extract_ical_entries
+    """
+    try:
+        header: List[bytes] = []
+        event: Optional[List[bytes]] = None
+        entries = []
+        parsed_header_lines = None
+
+        def parse_header() -> None:
+            nonlocal parsed_header_lines
+            Calendar.from_ical(b"".join(header) + b"END:VCALENDAR\r\n")
+            parsed_header_lines = len(header)
+
+        def parse_event(lines: List[bytes]) -> None:
+            # A lone VEVENT parses to that component; an unterminated one raises
+            component = Calendar.from_ical(b"".join(lines))
+            entries.append(_event_to_entry(component))
+
+        def feed(line: bytes) -> None:
+            nonlocal event
+            # Component markers are case-insensitive, as in icalendar itself
+            content = line.rstrip(b"\r\n").upper()
+
+            if event is not None:
+                event.append(line)
+                if content == b"END:VEVENT":
+                    parse_event(event)
+                    event = None
+
+            elif content == b"BEGIN:VEVENT":
+                if parsed_header_lines is None:
+                    parse_header()
+                event = [line]
+
+            elif content != b"END:VCALENDAR":
+                header.append(line)
+
+        pending = b""
+        while chunk := fileobj.read(chunk_size):
+            *lines, pending = (pending + chunk).split(b"\n")
+            for line in lines:
+                feed(line + b"\n")
+
+        if pending:
+            feed(pending + b"\n")
+
+        # A truncated file leaves the last event open; parsing it reports the error
+        if event is not None:
+            parse_event(event)
+
+        # Parse the header if it was never parsed or grew after the first event
+        if parsed_header_lines != len(header):
+            parse_header()
 
         return entries, None
 
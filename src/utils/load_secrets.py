@@ -8,16 +8,26 @@ setup_logging()
 logger = get_logger(__name__)
 
 ### SECRETS ###
+SECRET_KEYS = ("NEBIUS_API_KEY", "NEBIUS_MODEL")
+
+
 def load_secrets(secrets_file: str):
     """
     Load secrets from Python file into environment variables.
 
+    If every expected secret is already set in the environment (e.g. inherited
+    from a parent process), the file is not read at all.
+
     Args:
         secrets_file (str): Path to the Python file containing secrets
 
     Returns:
         bool: True if secrets were loaded successfully
     """
+    if all(key in os.environ for key in SECRET_KEYS):
+        logger.debug(f"Secrets already present in environment, skipping {secrets_file}")
+        return True
+
     try:
         # Import secrets from the specified file
         spec = importlib.util.spec_from_file_location("secrets", secrets_file)
@@ -25,8 +35,8 @@ def load_secrets(secrets_file: str):
         spec.loader.exec_module(secrets)
 
         # Set environment variables
-        os.environ["NEBIUS_API_KEY"] = secrets.NEBIUS_API_KEY
-        os.environ["NEBIUS_MODEL"] = secrets.NEBIUS_MODEL
+        for key in SECRET_KEYS:
+            os.environ[key] = getattr(secrets, key)
         return True
 
     except Exception as e:
@@ -0,0 +1,103 @@
+"""
+Solver Lifecycle Helpers for Yuga Planner Tests
+
+Tracks solver jobs started by tests and shuts the shared solver manager down
+exactly once when the interpreter exits, however the test run ends (including
+pytest -x and direct execution of a test file).
+
+Usage:
+    from tests.solver_lifecycle import solver_job
+
+    with solver_job(job_id):
+        solved_schedule = await StateService.wait_for_solved_schedule(job_id, timeout)
+"""
+
+import atexit
+from contextlib import contextmanager
+from typing import Iterator, Set
+
+from tests.test_utils import get_test_logger
+
+from constraint_solvers.timetable.solver import solver_manager
+from src.services import StateService
+from state import app_state
+
+logger = get_test_logger(__name__)
+
+# Bind solver lifecycle methods once. The Python SolverManager exposes
+# snake_case names; fall back to the Java-style names on older builds.
+_TERMINATE = getattr(solver_manager, "terminate_early", None) or getattr(
+    solver_manager, "terminateEarly", None
+)
+_CLOSE = getattr(solver_manager, "close", None) or getattr(
+    solver_manager, "shutdown", None
+)
+
+_active_jobs: Set[str] = set()
+_shut_down = False
+
+
+def register_job(job_id: str) -> None:
+    """Track a solver job so it is terminated at exit if a test leaves it running."""
+    _active_jobs.add(job_id)
+
+
+def unregister_job(job_id: str) -> None:
+    """Terminate a tracked solver job and release its stored solution."""
+    _active_jobs.discard(job_id)
+
+    if _TERMINATE is None:
+        logger.warning("⚠️ terminate_early method not available on solver_manager")
+
+    else:
+        try:
+            _TERMINATE(job_id)
+            logger.info(f"🧹 Terminated solver job: {job_id}")
+
+        except Exception as e:
+            logger.warning(f"⚠️ Error terminating solver job {job_id}: {e}")
+
+    # Release the job's stored solution so schedules don't pile up in app state
+    StateService.pop_solved_schedule(job_id)
+
+
+@contextmanager
+def solver_job(job_id: str) -> Iterator[str]:
+    """Terminate the given solver job when the block exits, however it exits."""
+    register_job(job_id)
+
+    try:
+        yield job_id
+
+    finally:
+        unregister_job(job_id)
+
+
+def _terminate_all() -> None:
+    """Terminate leftover jobs, clear stored schedules and close the solver manager."""
+    global _shut_down
+
+    if _shut_down:
+        return
+    _shut_down = True
+
+    for job_id in list(_active_jobs):
+        unregister_job(job_id)
+
+    app_state.clear_solved_schedules()
+
+    # Closing the manager also terminates any jobs still running
+    if _CLOSE is None:
+        logger.warning("⚠️ No explicit close/shutdown method found on solver manager")
+        return
+
+    try:
+        _CLOSE()
+        logger.info("🔒 Closed solver manager")
+
+    except Exception as e:
+        # Don't fail the run if cleanup fails, but log it
+        logger.warning(f"⚠️ Error during solver cleanup: {e}")
+
+
+atexit.register(_terminate_all)
@@ -1,7 +1,10 @@
 import icalendar
+import io
 import sys
 from pathlib import Path
 
+from utils.extract_calendar import extract_ical_entries, extract_ical_entries_stream
+
 # Import standardized test utilities
 from tests.test_utils import get_test_logger, create_test_results
 
@@ -56,6 +59,68 @@ def test_calendar_operations():
     )
 
 
+def test_stream_extraction_matches_buffered():
+    """Test that streamed calendar extraction matches whole-file extraction"""
+
+    logger.start_test("Testing streamed calendar extraction")
+
+    ics_path = Path("tests/data/calendar.ics")
+
+    expected, error = extract_ical_entries(ics_path.read_bytes())
+    assert error is None, f"Buffered extraction failed: {error}"
+
+    # A tiny chunk size forces lines and events to straddle read boundaries
+    with open(ics_path, "rb") as f:
+        entries, error = extract_ical_entries_stream(f, chunk_size=16)
+
+    assert error is None, f"Streamed extraction failed: {error}"
+    assert entries == expected, "Streamed entries should match buffered entries"
+
+    logger.pass_test(f"Streamed extraction matches - {len(entries)} entries")
+
+
+def test_stream_extraction_reports_truncated_event():
+    """Test that an unterminated last VEVENT is an error, as in buffered extraction"""
+
+    logger.start_test("Testing streamed extraction of a truncated calendar")
+
+    data = Path("tests/data/calendar.ics").read_bytes()
+    truncated = data[: data.rfind(b"END:VEVENT")]
+
+    _, buffered_error = extract_ical_entries(truncated)
+    assert buffered_error is not None, "Buffered extraction should reject the file"
+
+    entries, error = extract_ical_entries_stream(io.BytesIO(truncated))
+
+    assert entries is None, "Truncated calendar should not return partial entries"
+    assert error is not None, "Truncated calendar should report an error"
+
+    logger.pass_test("Truncated calendar reports an error")
+
+
+def test_stream_extraction_case_insensitive_markers():
+    """Test that BEGIN/END markers are matched regardless of case"""
+
+    logger.start_test("Testing streamed extraction with mixed-case markers")
+
+    data = Path("tests/data/calendar.ics").read_bytes()
+    expected, error = extract_ical_entries(data)
+    assert error is None, f"Buffered extraction failed: {error}"
+
+    mixed_case = (
+        data.replace(b"BEGIN:VEVENT", b"begin:vevent")
+        .replace(b"END:VEVENT", b"End:VEvent")
+        .replace(b"END:VCALENDAR", b"end:vcalendar")
+    )
+
+    entries, error = extract_ical_entries_stream(io.BytesIO(mixed_case))
+
+    assert error is None, f"Streamed extraction failed: {error}"
+    assert entries == expected, "Mixed-case markers should yield the same entries"
+
+    logger.pass_test(f"Mixed-case markers parsed - {len(entries)} entries")
+
+
 if __name__ == "__main__":
     logger.section("Calendar Operations Tests")
 
@@ -64,6 +129,17 @@ if __name__ == "__main__":
 
     # Run the test
     results.run_test("calendar_operations", test_calendar_operations)
+    results.run_test(
+        "stream_extraction_matches_buffered", test_stream_extraction_matches_buffered
+    )
+    results.run_test(
+        "stream_extraction_reports_truncated_event",
+        test_stream_extraction_reports_truncated_event,
+    )
+    results.run_test(
+        "stream_extraction_case_insensitive_markers",
+        test_stream_extraction_case_insensitive_markers,
+    )
 
     # Generate summary and exit with appropriate code
     all_passed = results.summary()
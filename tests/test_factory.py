@@ -1,11 +1,15 @@
 import pytest
-import time
+import pytest_asyncio
+import pickle
 import pandas as pd
-import traceback
 import sys
-from io import StringIO
+import functools
+import mmap
+import re
+from dataclasses import fields
+from types import MappingProxyType
 from datetime import datetime, date, timedelta
-from typing import List, Dict, Tuple, Optional, Any
+from typing import Dict, Tuple, Optional, Any, Mapping, Sequence, Final
 
 from src.utils.load_secrets import load_secrets
 
@@ -19,72 +23,15 @@ logger = get_test_logger(__name__)
 load_secrets("tests/secrets/creds.py")
 
 import factory.data.provider as data_provider
-from src.utils.extract_calendar import extract_ical_entries
+from src.utils.extract_calendar import (
+    extract_ical_entries_stream,
+    validate_calendar_working_hours,
+)
 from src.handlers.mcp_backend import process_message_and_attached_file
 from src.services import ScheduleService, StateService
 from src.services.data import DataService
 from src.factory.data.formatters import schedule_to_dataframe
-
-# Add cleanup fixture for proper solver shutdown
-@pytest.fixture(scope="session", autouse=True)
-def cleanup_solver():
-    """Automatically cleanup solver resources after all tests complete."""
-    yield  # Run tests
-
-    # Cleanup: Terminate all active solver jobs and shutdown solver manager
-    try:
-        import time
-        from constraint_solvers.timetable.solver import solver_manager
-        from src.state import app_state
-
-        logger.info("🧹 Starting solver cleanup...")
-
-        # Clear all stored schedules first
-        app_state.clear_solved_schedules()
-
-        # Terminate all active solver jobs gracefully using the Timefold terminateEarly method
-        if hasattr(solver_manager, "terminateEarly"):
-            # According to Timefold docs, terminateEarly() affects all jobs for this manager
-            try:
-                solver_manager.terminateEarly()
-                logger.info("🧹 Terminated all active solver jobs")
-
-                # Give some time for the termination to complete
-                time.sleep(0.5)
-
-            except Exception as e:
-                logger.warning(f"⚠️ Error terminating solver jobs: {e}")
-
-        # Try additional cleanup methods if available
-        if hasattr(solver_manager, "close"):
-            try:
-                solver_manager.close()
-                logger.info("🔒 Closed solver manager")
-
-            except Exception as e:
-                logger.warning(f"⚠️ Error closing solver manager: {e}")
-
-        elif hasattr(solver_manager, "shutdown"):
-            try:
-                solver_manager.shutdown()
-                logger.info("🔒 Shutdown solver manager")
-
-            except Exception as e:
-                logger.warning(f"⚠️ Error shutting down solver manager: {e}")
-
-        else:
-            logger.warning(
-                "⚠️ No explicit close/shutdown method found on solver manager"
-            )
-
-        # Additional small delay to allow cleanup to complete
-        time.sleep(0.2)
-
-        logger.info("✅ Solver cleanup completed successfully")
-
-    except Exception as e:
-        logger.warning(f"⚠️ Error during solver cleanup: {e}")
-        # Don't fail tests if cleanup fails, but log it
+from tests.solver_lifecycle import solver_job
 
 
 # Test Configuration
@@ -98,78 +45,106 @@ TEST_CONFIG = {
     "datetime_tolerance_seconds": 60,
 }
 
+# Values read by the helpers on every call, bound once at import
+_DEFAULT_PROJECT_ID: Final[str] = TEST_CONFIG["default_project_id"]
+_DEFAULT_EMPLOYEE_COUNT: Final[int] = TEST_CONFIG["default_employee_count"]
+_SOLVER_TIMEOUT: Final[int] = (
+    TEST_CONFIG["solver_max_polls"] * TEST_CONFIG["solver_poll_interval"]
+)
+_DATETIME_TOLERANCE_SECONDS: Final[int] = TEST_CONFIG["datetime_tolerance_seconds"]
+
+# Canonical request for the shared mcp_initial_df fixture
+_MCP_USER_MESSAGE: Final[str] = "Set up CI/CD pipeline and configure monitoring system"
+
+# Working-hours violations expected in the invalid calendar's error message
+_VIOLATION_PATTERNS = {
+    "early morning": re.compile(r"Early Morning Meeting|07:00|before 9:00"),
+    "evening": re.compile(r"Evening Meeting|21:00|after 18:00"),
+    "very late": re.compile(r"Very Late Meeting|22:00"),
+}
+
 
 # Fixtures and Helper Functions
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_calendar_entries():
-    """Load valid calendar entries for testing."""
+    """Load valid calendar entries for testing (shared, read-only)."""
     return load_calendar_entries(TEST_CONFIG["valid_calendar"])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_calendar_entries():
-    """Load invalid calendar entries for testing."""
+    """Load invalid calendar entries for testing (shared, read-only)."""
     return load_calendar_entries(TEST_CONFIG["invalid_calendar"])
 
 
-def load_calendar_entries(file_path: str) -> List[Dict]:
-    """Load and extract calendar entries from an iCS file."""
-    with open(file_path, "rb") as f:
-        file_bytes = f.read()
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def mcp_initial_df(valid_calendar_entries):
+    """Generate MCP data once for the tests that only inspect the initial schedule."""
+    return await generate_mcp_data_helper(valid_calendar_entries, _MCP_USER_MESSAGE)
+
+
+@functools.lru_cache(maxsize=4)
+def load_calendar_entries(file_path: str) -> Tuple[Mapping, ...]:
+    """
+    Load and extract calendar entries from an iCS file.
+
+    Results are cached per path and returned as read-only mappings, since the
+    same entries are shared by every test in the session.
+    """
+    # Map the file read-only so events are sliced straight from the page cache
+    with open(file_path, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm:
+        entries, error = extract_ical_entries_stream(mm)
 
-    entries, error = extract_ical_entries(file_bytes)
     assert error is None, f"Calendar extraction failed: {error}"
     assert len(entries) > 0, "No calendar entries found"
 
-    return entries
+    return tuple(MappingProxyType(entry) for entry in entries)
 
 
-def print_calendar_entries(entries: List[Dict], title: str = "Calendar Entries"):
+def print_calendar_entries(entries: Sequence[Mapping], title: str = "Calendar Entries"):
     """Print calendar entries in a formatted way."""
-    logger.debug(f"📅 {title} ({len(entries)} entries):")
+    logger.debug("📅 %s (%d entries):", title, len(entries))
     for i, entry in enumerate(entries):
-        start_dt = entry.get("start_datetime")
-        end_dt = entry.get("end_datetime")
-        logger.debug(f"  {i+1}. {entry['summary']}: {start_dt} → {end_dt}")
+        logger.debug(
+            "  %d. %s: %s → %s",
+            i + 1,
+            entry["summary"],
+            entry.get("start_datetime"),
+            entry.get("end_datetime"),
+        )
 
 
 def calculate_required_schedule_days(
-    calendar_entries: List[Dict], buffer_days: int = 30
+    calendar_entries: Sequence[Mapping], buffer_days: int = 30
 ) -> int:
     """Calculate required schedule days based on calendar entries."""
-    if not calendar_entries:
+    # Collect each entry's local calendar dates in one pass, then reduce in C
+    dates = [
+        dt.date()
+        for entry in calendar_entries
+        for dt in (entry.get("start_datetime"), entry.get("end_datetime"))
+        if isinstance(dt, datetime)
+    ]
+
+    if not dates:
         return 60  # Default
 
-    earliest_date = None
-    latest_date = None
-
-    for entry in calendar_entries:
-        for dt_key in ["start_datetime", "end_datetime"]:
-            dt = entry.get(dt_key)
-            if dt and isinstance(dt, datetime):
-                entry_date = dt.date()
-                if earliest_date is None or entry_date < earliest_date:
-                    earliest_date = entry_date
-                if latest_date is None or entry_date > latest_date:
-                    latest_date = entry_date
-
-    if earliest_date and latest_date:
-        calendar_span = (latest_date - earliest_date).days + 1
-        return calendar_span + buffer_days
-    else:
-        return 60  # Fallback
+    calendar_span = (max(dates) - min(dates)).days + 1
+    return calendar_span + buffer_days
 
 
 async def generate_mcp_data_helper(
-    calendar_entries: List[Dict],
+    calendar_entries: Sequence[Mapping],
     user_message: str,
     project_id: str = None,
     employee_count: int = None,
     days_in_schedule: int = None,
 ) -> pd.DataFrame:
     """Helper function to generate MCP data with consistent defaults."""
-    project_id = project_id or TEST_CONFIG["default_project_id"]
-    employee_count = employee_count or TEST_CONFIG["default_employee_count"]
+    project_id = project_id or _DEFAULT_PROJECT_ID
+    employee_count = employee_count or _DEFAULT_EMPLOYEE_COUNT
 
     if days_in_schedule is None:
         days_in_schedule = calculate_required_schedule_days(calendar_entries)
@@ -187,7 +162,7 @@ async def solve_schedule_with_polling(
     initial_df: pd.DataFrame, employee_count: int = None
 ) -> Optional[pd.DataFrame]:
     """Solve schedule with polling and return the result."""
-    employee_count = employee_count or TEST_CONFIG["default_employee_count"]
+    employee_count = employee_count or _DEFAULT_EMPLOYEE_COUNT
     required_days = calculate_required_schedule_days([])  # Use default
 
     # Extract date range from pinned tasks for better schedule length calculation
@@ -196,7 +171,7 @@ async def solve_schedule_with_polling(
         required_days = calculate_required_schedule_days_from_df(pinned_tasks)
 
     state_data = {
-        "task_df_json": initial_df.to_json(orient="split"),
+        "task_df": initial_df,
         "employee_count": employee_count,
         "days_in_schedule": required_days,
     }
@@ -215,70 +190,35 @@ async def solve_schedule_with_polling(
     logger.info(f"Solver started with job_id: {job_id}")
     logger.debug(f"Initial status: {status}")
 
-    # Poll for solution using the correct StateService methods
-    max_polls = TEST_CONFIG["solver_max_polls"]
-    poll_interval = TEST_CONFIG["solver_poll_interval"]
+    # Wait for the solver to store a solution instead of sleeping between polls
+    timeout = _SOLVER_TIMEOUT
 
     final_df = None
 
-    try:
-        for poll_count in range(1, max_polls + 1):
-            logger.debug(f"  Polling {poll_count}/{max_polls}...")
-            time.sleep(poll_interval)
-
-            # Use StateService to check for completed solution
-            if StateService.has_solved_schedule(job_id):
-                solved_schedule = StateService.get_solved_schedule(job_id)
-
-                if solved_schedule is not None:
-                    logger.info(f"✅ Schedule solved after {poll_count} polls!")
-
-                    # Convert solved schedule to DataFrame
-                    final_df = schedule_to_dataframe(solved_schedule)
-
-                    # Generate status message to check for failures
-                    status_message = ScheduleService.generate_status_message(
-                        solved_schedule
-                    )
-
-                    if "CONSTRAINTS VIOLATED" in status_message:
-                        logger.warning(f"❌ Solver failed: {status_message}")
-                        final_df = None
-                    else:
-                        logger.info(f"✅ Solver succeeded: {status_message}")
-
-                    break
-
-        if final_df is None:
-            logger.warning("⏰ Solver timed out after max polls")
-
-    finally:
-        # Clean up: Ensure solver job is terminated
-        try:
-            from constraint_solvers.timetable.solver import solver_manager
-
-            # Terminate the specific job to free resources using Timefold's terminateEarly
-            if hasattr(solver_manager, "terminateEarly"):
-                try:
-                    solver_manager.terminateEarly(job_id)
-                    logger.info(f"🧹 Terminated solver job: {job_id}")
-                except Exception as e:
-                    # If specific job termination fails, try to terminate all jobs
-                    logger.warning(f"⚠️ Error terminating specific job {job_id}: {e}")
-                    try:
-                        solver_manager.terminateEarly()
-                        logger.info(
-                            f"🧹 Terminated all solver jobs after specific termination failed"
-                        )
-                    except Exception as e2:
-                        logger.warning(f"⚠️ Could not terminate any solver jobs: {e2}")
+    with solver_job(job_id):
+        # The first stored solution is usually the construction heuristic's;
+        # give local search until the timeout to reach a feasible one
+        solved_schedule = await StateService.wait_for_solved_schedule(
+            job_id, timeout=timeout, until_feasible=True
+        )
+
+        if solved_schedule is not None:
+            logger.info("✅ Schedule solved!")
+
+            # Convert solved schedule to DataFrame
+            final_df = schedule_to_dataframe(solved_schedule)
+
+            # Generate status message to check for failures
+            status_message = ScheduleService.generate_status_message(solved_schedule)
+
+            if "CONSTRAINTS VIOLATED" in status_message:
+                logger.warning(f"❌ Solver failed: {status_message}")
+                final_df = None
             else:
-                logger.warning(
-                    f"⚠️ terminateEarly method not available on solver_manager"
-                )
+                logger.info(f"✅ Solver succeeded: {status_message}")
 
-        except Exception as e:
-            logger.warning(f"⚠️ Could not access solver_manager for cleanup: {e}")
+        else:
+            logger.warning(f"⏰ Solver timed out after {timeout}s")
 
     return final_df
 
@@ -287,45 +227,39 @@ def calculate_required_schedule_days_from_df(
     pinned_df: pd.DataFrame, buffer_days: int = 30
 ) -> int:
     """Calculate required schedule days from DataFrame with pinned tasks."""
-    earliest_date = None
-    latest_date = None
-
-    for _, row in pinned_df.iterrows():
-        for date_col in ["Start", "End"]:
-            date_val = row.get(date_col)
+    columns = [col for col in ("Start", "End") if col in pinned_df]
+    if not columns:
+        return 60  # Default
 
-            if date_val is not None:
-                try:
-                    if isinstance(date_val, str):
-                        dt = datetime.fromisoformat(date_val.replace("Z", "+00:00"))
+    values = pinned_df[columns].stack()
 
-                    else:
-                        dt = pd.to_datetime(date_val).to_pydatetime()
+    # Keep wall-clock dates when values share a timezone; mixed offsets can
+    # only be ordered after normalising to UTC. Unparseable values become NaT.
+    parsed = to_naive_datetime_series(values)
+    if parsed is None:
+        parsed = pd.to_datetime(values, errors="coerce", utc=True, format="ISO8601")
 
-                    if earliest_date is None or dt.date() < earliest_date:
-                        earliest_date = dt.date()
+    parsed = parsed.dropna()
+    if parsed.empty:
+        return 60  # Default
 
-                    if latest_date is None or dt.date() > latest_date:
-                        latest_date = dt.date()
+    calendar_span = (parsed.max().date() - parsed.min().date()).days + 1
+    return calendar_span + buffer_days
 
-                except:
-                    continue
 
-    if earliest_date and latest_date:
-        calendar_span = (latest_date - earliest_date).days + 1
-
-        return calendar_span + buffer_days
-
-    else:
-        return 60  # Default
+def pinned_flags(df: pd.DataFrame) -> pd.Series:
+    """Return the Pinned column, or all-False if the DataFrame has none."""
+    return df.get("Pinned", pd.Series(False, index=df.index))
 
 
 def analyze_schedule_dataframe(
     df: pd.DataFrame, title: str = "Schedule Analysis"
 ) -> Dict[str, Any]:
     """Analyze a schedule DataFrame and return summary information."""
-    existing_tasks = df[df["Project"] == "EXISTING"]
-    project_tasks = df[df["Project"] == "PROJECT"]
+    # Split by project in one pass instead of one boolean mask per project
+    groups = dict(iter(df.groupby("Project", sort=False)))
+    existing_tasks = groups.get("EXISTING", df.iloc[:0])
+    project_tasks = groups.get("PROJECT", df.iloc[:0])
 
     analysis = {
         "total_tasks": len(df),
@@ -335,28 +269,28 @@ def analyze_schedule_dataframe(
         "project_df": project_tasks,
     }
 
-    logger.debug(f"\n📊 {title} ({analysis['total_tasks']} tasks):")
-    logger.debug(f"  - EXISTING (calendar): {analysis['existing_tasks']} tasks")
-    logger.debug(f"  - PROJECT (LLM): {analysis['project_tasks']} tasks")
+    logger.debug("\n📊 %s (%d tasks):", title, analysis["total_tasks"])
+    logger.debug("  - EXISTING (calendar): %d tasks", analysis["existing_tasks"])
+    logger.debug("  - PROJECT (LLM): %d tasks", analysis["project_tasks"])
 
     return analysis
 
 
 def verify_calendar_tasks_pinned(existing_tasks_df: pd.DataFrame) -> bool:
     """Verify that all calendar tasks are pinned."""
-    logger.debug(f"\n🔒 Verifying calendar tasks are pinned:")
-    all_pinned = True
+    pinned = pinned_flags(existing_tasks_df).astype(bool)
 
-    for _, task in existing_tasks_df.iterrows():
-        is_pinned = task.get("Pinned", False)
-        task_name = task["Task"]
-        logger.debug(f"  - {task_name}: pinned = {is_pinned}")
+    # Per-row narration is debug-only; failures are always reported
+    logger.debug("\n🔒 Verifying calendar tasks are pinned:")
+    for task_name, is_pinned in zip(existing_tasks_df["Task"], pinned):
+        logger.debug("  - %s: pinned = %s", task_name, is_pinned)
 
-        if not is_pinned:
-            all_pinned = False
-            logger.warning(f"    ❌ Calendar task should be pinned!")
-        else:
-            logger.info(f"    ✅ Calendar task properly pinned")
+    for task_name in existing_tasks_df.loc[~pinned, "Task"]:
+        logger.warning(f"  - {task_name}: ❌ Calendar task should be pinned!")
+
+    all_pinned = bool(pinned.all())
+    if all_pinned:
+        logger.info(f"✅ All {len(pinned)} calendar tasks properly pinned")
 
     return all_pinned
 
@@ -365,51 +299,113 @@ def verify_time_preservation(
     original_times: Dict, final_tasks_df: pd.DataFrame
 ) -> bool:
     """Verify that calendar tasks preserved their original times."""
-    logger.debug(f"\n🔍 Verifying calendar tasks preserved their original times:")
     time_preserved = True
 
-    for _, task in final_tasks_df.iterrows():
-        task_name = task["Task"]
-        final_start = task["Start"]
+    known = final_tasks_df["Task"].isin(original_times.keys())
+
+    for task_name in final_tasks_df.loc[~known, "Task"]:
+        logger.warning(f"  - {task_name}: ❌ Not found in original data")
+        time_preserved = False
+
+    known_df = final_tasks_df[known]
+    original_starts = pd.Series(
+        [original_times[task_name]["start"] for task_name in known_df["Task"]],
+        index=known_df.index,
+        dtype=object,
+    )
+
+    # Normalize and compare all times at once
+    preserved_mask = compare_datetime_series(original_starts, known_df["Start"])
+
+    logger.debug("\n🔍 Verifying calendar tasks preserved their original times:")
+    for task_name, original_start, final_start, preserved in zip(
+        known_df["Task"], original_starts, known_df["Start"], preserved_mask
+    ):
+        logger.debug("  - %s:", task_name)
+        logger.debug("    Original: %s", original_start)
+        logger.debug("    Final:    %s", final_start)
+        logger.debug("    Preserved: %s", "✅" if preserved else "❌")
+
+    return time_preserved and bool(preserved_mask.all())
+
+
+def to_datetime_series(values: pd.Series) -> Optional[pd.Series]:
+    """Parse a Series to datetimes, keeping any timezone, or None if it can't be vectorized."""
+    try:
+        parsed = pd.to_datetime(values, errors="coerce", format="ISO8601")
 
-        original = original_times.get(task_name)
-        if original is None:
-            logger.warning(f"  - {task_name}: ❌ Not found in original data")
-            time_preserved = False
-            continue
+    except (TypeError, ValueError):
+        return None
 
-        # Normalize and compare times
-        preserved = compare_datetime_values(original["start"], final_start)
+    if not pd.api.types.is_datetime64_any_dtype(parsed):
+        return None
 
-        logger.debug(f"  - {task_name}:")
-        logger.debug(f"    Original: {original['start']}")
-        logger.debug(f"    Final:    {final_start}")
-        logger.debug(f"    Preserved: {'✅' if preserved else '❌'}")
+    return parsed
 
-        if not preserved:
-            time_preserved = False
 
-    return time_preserved
+def to_naive_datetime_series(values: pd.Series) -> Optional[pd.Series]:
+    """Parse a Series to naive wall-clock datetimes, or None if it can't be vectorized."""
+    parsed = to_datetime_series(values)
+
+    if parsed is not None and parsed.dt.tz is not None:
+        parsed = parsed.dt.tz_localize(None)
+
+    return parsed
+
+
+def compare_datetime_series(
+    first: pd.Series, second: pd.Series, tolerance_seconds: int = None
+) -> pd.Series:
+    """Element-wise compare_datetime_values for two aligned Series."""
+    tolerance = tolerance_seconds or _DATETIME_TOLERANCE_SECONDS
+
+    first_parsed = to_datetime_series(first)
+    second_parsed = to_datetime_series(second)
+
+    if first_parsed is None or second_parsed is None:
+        # Mixed or unparseable values: fall back to scalar comparison
+        return pd.Series(
+            [
+                compare_datetime_values(dt1, dt2, tolerance)
+                for dt1, dt2 in zip(first, second)
+            ],
+            index=first.index,
+            dtype=bool,
+        )
+
+    first_aware = first_parsed.dt.tz is not None
+    second_aware = second_parsed.dt.tz is not None
+
+    # Both aware: compare instants. Only one aware: compare wall-clock times.
+    if first_aware and second_aware:
+        first_parsed = first_parsed.dt.tz_convert("UTC")
+        second_parsed = second_parsed.dt.tz_convert("UTC")
+
+    elif first_aware:
+        first_parsed = first_parsed.dt.tz_localize(None)
+
+    elif second_aware:
+        second_parsed = second_parsed.dt.tz_localize(None)
+
+    # NaT differences compare as False, matching the scalar fallback
+    return (first_parsed - second_parsed).abs() < pd.Timedelta(seconds=tolerance)
 
 
 def compare_datetime_values(dt1: Any, dt2: Any, tolerance_seconds: int = None) -> bool:
     """Compare two datetime values with tolerance for timezone differences."""
-    tolerance = tolerance_seconds or TEST_CONFIG["datetime_tolerance_seconds"]
+    tolerance = tolerance_seconds or _DATETIME_TOLERANCE_SECONDS
 
     # Convert to comparable datetime objects
     try:
-        if isinstance(dt1, str):
-            dt1 = datetime.fromisoformat(dt1.replace("Z", "+00:00"))
-
-        if isinstance(dt2, str):
-            dt2 = datetime.fromisoformat(dt2.replace("Z", "+00:00"))
+        dt1 = pd.Timestamp(dt1)
+        dt2 = pd.Timestamp(dt2)
 
         # Normalize timezones for comparison
-        if dt1.tzinfo is not None and dt2.tzinfo is None:
-            dt1 = dt1.replace(tzinfo=None)
+        if dt1.tz is not None and dt2.tz is None:
+            dt1 = dt1.tz_localize(None)
 
-        elif dt1.tzinfo is None and dt2.tzinfo is not None:
-            dt2 = dt2.replace(tzinfo=None)
+        elif dt1.tz is None and dt2.tz is not None:
+            dt2 = dt2.tz_localize(None)
 
         return abs((dt1 - dt2).total_seconds()) < tolerance
 
@@ -419,19 +415,24 @@ def compare_datetime_values(dt1: Any, dt2: Any, tolerance_seconds: int = None) -
 
 def store_original_calendar_times(existing_tasks_df: pd.DataFrame) -> Dict[str, Dict]:
     """Store original calendar task times for later comparison."""
-    original_times = {}
-
-    for _, task in existing_tasks_df.iterrows():
-        original_times[task["Task"]] = {
-            "start": task["Start"],
-            "end": task["End"],
-            "pinned": task.get("Pinned", False),
-        }
+    original_times = {
+        task_name: {"start": start, "end": end, "pinned": is_pinned}
+        for task_name, start, end, is_pinned in zip(
+            existing_tasks_df["Task"],
+            existing_tasks_df["Start"],
+            existing_tasks_df["End"],
+            pinned_flags(existing_tasks_df),
+        )
+    }
 
     logger.debug("\n📌 Original calendar task times:")
     for task_name, times in original_times.items():
         logger.debug(
-            f"  - {task_name}: {times['start']} → {times['end']} (pinned: {times['pinned']})"
+            "  - %s: %s → %s (pinned: %s)",
+            task_name,
+            times["start"],
+            times["end"],
+            times["pinned"],
         )
 
     return original_times
@@ -439,39 +440,37 @@ def store_original_calendar_times(existing_tasks_df: pd.DataFrame) -> Dict[str,
 
 def verify_llm_tasks_scheduled(project_tasks_df: pd.DataFrame) -> bool:
     """Verify that LLM tasks are properly scheduled and not pinned."""
-    logger.debug(f"\n🔄 Verifying LLM tasks were properly scheduled:")
     all_scheduled = True
 
-    for _, task in project_tasks_df.iterrows():
-        task_name = task["Task"]
-        start_time = task["Start"]
-        is_pinned = task.get("Pinned", False)
+    logger.debug("\n🔄 Verifying LLM tasks were properly scheduled:")
 
-        logger.debug(f"  - {task_name}:")
-        logger.debug(f"    Scheduled at: {start_time}")
-        logger.debug(f"    Pinned: {is_pinned}")
+    for task_name, start_time, is_pinned in zip(
+        project_tasks_df["Task"],
+        project_tasks_df["Start"],
+        pinned_flags(project_tasks_df),
+    ):
+        logger.debug("  - %s:", task_name)
+        logger.debug("    Scheduled at: %s", start_time)
+        logger.debug("    Pinned: %s", is_pinned)
 
         # LLM tasks should not be pinned
         if is_pinned:
             all_scheduled = False
-            logger.warning(f"    ❌ LLM task should not be pinned!")
-
-        else:
-            logger.info(f"    ✅ LLM task properly unpinned")
+            logger.warning(f"  - {task_name}: ❌ LLM task should not be pinned!")
 
         # LLM tasks should have been scheduled to actual times
         if start_time is None or start_time == "":
             all_scheduled = False
-            logger.warning(f"    ❌ LLM task was not scheduled!")
+            logger.warning(f"  - {task_name}: ❌ LLM task was not scheduled!")
 
-        else:
-            logger.info(f"    ✅ LLM task was scheduled")
+    if all_scheduled:
+        logger.info(f"✅ All {len(project_tasks_df)} LLM tasks unpinned and scheduled")
 
     return all_scheduled
 
 
 # Test Functions
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_factory_demo_agent():
     # Use a simple string as the project description
     test_input = "Test project for schedule generation."
@@ -485,46 +484,47 @@ async def test_factory_demo_agent():
     assert len(schedule.tasks) > 0
 
     # Verify employee skills
+    required_skills = frozenset(data_provider.SKILL_SET.required_skills)
     for employee in schedule.employees:
         assert len(employee.skills) > 0
         # Check that each employee has at least one required skill
-        assert any(
-            skill in data_provider.SKILL_SET.required_skills
-            for skill in employee.skills
-        )
+        assert not required_skills.isdisjoint(employee.skills)
+
+    # Verify task properties (project_id is a schema field, so check it once)
+    assert "project_id" in {f.name for f in fields(type(schedule.tasks[0]))}
 
-    # Verify task properties
     for task in schedule.tasks:
         assert task.duration_slots > 0
         assert task.required_skill
-        assert hasattr(task, "project_id")
 
     # Print schedule details for debugging
-    logger.info(f"Employee names: {[e.name for e in schedule.employees]}")
+    logger.debug("Employee names: %s", [e.name for e in schedule.employees])
     logger.info(f"Tasks count: {len(schedule.tasks)}")
     logger.info(f"Total slots: {schedule.schedule_info.total_slots}")
 
 
-@pytest.mark.asyncio
-async def test_factory_mcp(valid_calendar_entries):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_factory_mcp(valid_calendar_entries, mcp_initial_df):
     print_calendar_entries(valid_calendar_entries, "Loaded Calendar Entries")
 
-    # Use a made-up user message
-    user_message = "Create a new AWS VPC."
-
-    # Call generate_mcp_data directly
-    df = await generate_mcp_data_helper(valid_calendar_entries, user_message)
+    # Data comes from generate_mcp_data via the shared session fixture
+    df = mcp_initial_df
 
     # Assert the DataFrame is not empty
     assert df is not None
     assert not df.empty
 
-    # Print the DataFrame for debug
-    logger.debug(df)
+    # Validate whole columns at once instead of iterating rows
+    assert (df["Duration (hours)"].to_numpy() > 0).all()
+    assert df["Required Skill"].notna().all()
+    assert df["Task"].notna().all()
 
+    # Print the DataFrame for debug (rendered only when debug output is enabled)
+    logger.debug("Generated DataFrame:\n%s", df)
 
-@pytest.mark.asyncio
-async def test_mcp_workflow_calendar_pinning(valid_calendar_entries):
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_mcp_workflow_calendar_pinning(valid_calendar_entries, mcp_initial_df):
     """
     Test that verifies calendar tasks (EXISTING) remain pinned to their original times
     while LLM tasks (PROJECT) are rescheduled around them in the MCP workflow.
@@ -535,9 +535,8 @@ async def test_mcp_workflow_calendar_pinning(valid_calendar_entries):
 
     print_calendar_entries(valid_calendar_entries, "Loaded Calendar Entries")
 
-    # Generate initial MCP data
-    user_message = "Set up CI/CD pipeline and configure monitoring system"
-    initial_df = await generate_mcp_data_helper(valid_calendar_entries, user_message)
+    # Work on a copy so solving cannot leak into the other tests' shared data
+    initial_df = mcp_initial_df.copy()
 
     # Analyze initial schedule
     analysis = analyze_schedule_dataframe(initial_df, "Generated Initial Data")
@@ -579,7 +578,7 @@ async def test_mcp_workflow_calendar_pinning(valid_calendar_entries):
     )
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_calendar_validation_rejects_invalid_entries(invalid_calendar_entries):
     """
     Test that calendar validation properly rejects entries that violate working hours constraints.
@@ -607,25 +606,18 @@ async def test_calendar_validation_rejects_invalid_entries(invalid_calendar_entr
     # Verify the error message contains expected constraint violations
     assert "Calendar entries violate working constraints" in error_message
     # Check for specific violations that should be detected
-    assert (
-        "Early Morning Meeting" in error_message
-        or "07:00" in error_message
-        or "before 9:00" in error_message
-    ), f"Should detect early morning violation in: {error_message}"
-    assert (
-        "Evening Meeting" in error_message
-        or "21:00" in error_message
-        or "after 18:00" in error_message
-    ), f"Should detect evening violation in: {error_message}"
-    assert (
-        "Very Late Meeting" in error_message or "22:00" in error_message
-    ), f"Should detect very late violation in: {error_message}"
+    for violation, pattern in _VIOLATION_PATTERNS.items():
+        assert pattern.search(
+            error_message
+        ), f"Should detect {violation} violation in: {error_message}"
 
     logger.info("✅ All expected constraint violations were detected!")
 
 
-@pytest.mark.asyncio
-async def test_calendar_validation_accepts_valid_entries(valid_calendar_entries):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_calendar_validation_accepts_valid_entries(
+    valid_calendar_entries, mcp_initial_df
+):
     """
     Test that calendar validation accepts valid entries and processing continues normally.
     """
@@ -635,37 +627,28 @@ async def test_calendar_validation_accepts_valid_entries(valid_calendar_entries)
 
     print_calendar_entries(valid_calendar_entries, "Valid Calendar Entries")
 
-    # Test that generate_mcp_data succeeds with valid calendar
-    user_message = "Simple test task"
+    # Run the same validator generate_mcp_data applies before any LLM call
+    is_valid, error_message = validate_calendar_working_hours(valid_calendar_entries)
+    assert is_valid, f"Valid calendar should pass validation, but got: {error_message}"
 
+    # generate_mcp_data already succeeded with the valid calendar in the fixture
+    initial_df = mcp_initial_df
     logger.debug(
-        f"\n✅ Attempting to generate MCP data with valid calendar (should succeed)..."
+        "✅ Validation passed! Generated %d tasks successfully", len(initial_df)
     )
 
-    try:
-        initial_df = await generate_mcp_data_helper(
-            valid_calendar_entries, user_message
-        )
-
-        logger.debug(
-            f"✅ Validation passed! Generated {len(initial_df)} tasks successfully"
-        )
-
-        # Analyze and verify the result
-        analysis = analyze_schedule_dataframe(initial_df, "Generated Schedule")
+    # Analyze and verify the result
+    analysis = analyze_schedule_dataframe(initial_df, "Generated Schedule")
 
-        assert analysis["existing_tasks"] > 0, "Should have calendar tasks"
-        assert analysis["project_tasks"] > 0, "Should have LLM tasks"
+    assert analysis["existing_tasks"] > 0, "Should have calendar tasks"
+    assert analysis["project_tasks"] > 0, "Should have LLM tasks"
 
-        # Verify all calendar tasks are pinned
-        calendar_pinned = verify_calendar_tasks_pinned(analysis["existing_df"])
-        assert calendar_pinned, "All calendar tasks should be properly pinned!"
-
-    except Exception as e:
-        pytest.fail(f"Valid calendar should not raise an error, but got: {e}")
+    # Verify all calendar tasks are pinned
+    calendar_pinned = verify_calendar_tasks_pinned(analysis["existing_df"])
+    assert calendar_pinned, "All calendar tasks should be properly pinned!"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_mcp_backend_end_to_end():
     """
     Test the complete MCP backend workflow using the actual handler function.
@@ -715,8 +698,8 @@ async def test_mcp_backend_end_to_end():
         existing_tasks = [t for t in schedule if t.get("Project") == "EXISTING"]
         project_tasks = [t for t in schedule if t.get("Project") == "PROJECT"]
 
-        print(f"🔒 EXISTING (calendar) tasks: {len(existing_tasks)}")
-        print(f"🔧 PROJECT (LLM) tasks: {len(project_tasks)}")
+        logger.info(f"🔒 EXISTING (calendar) tasks: {len(existing_tasks)}")
+        logger.info(f"🔧 PROJECT (LLM) tasks: {len(project_tasks)}")
 
         # Verify we have both types of tasks
         assert len(existing_tasks) > 0, "Should have calendar tasks"
@@ -726,16 +709,16 @@ async def test_mcp_backend_end_to_end():
         for task in project_tasks:
             task_name = task.get("Task", "Unknown")
             start_time = task.get("Start")
-            print(f"⏰ LLM task '{task_name}': scheduled at {start_time}")
+            logger.debug(f"⏰ LLM task '{task_name}': scheduled at {start_time}")
             assert (
                 start_time is not None
             ), f"LLM task '{task_name}' should have a scheduled start time"
 
-        print("🎯 MCP backend end-to-end test passed!")
+        logger.info("🎯 MCP backend end-to-end test passed!")
 
     elif result.get("status") == "timeout":
-        print("⏰ MCP backend timed out - this is acceptable for testing")
-        print("The solver may need more time for complex schedules")
+        logger.info("⏰ MCP backend timed out - this is acceptable for testing")
+        logger.info("The solver may need more time for complex schedules")
 
         # Still verify basic structure
         assert "calendar_entries" in result, "Result should contain calendar entries"
@@ -744,86 +727,91 @@ async def test_mcp_backend_end_to_end():
     else:
         # Handle error cases
         error_msg = result.get("error", "Unknown error")
-        print(f"❌ MCP backend failed: {error_msg}")
+        logger.error(f"❌ MCP backend failed: {error_msg}")
         assert False, f"MCP backend failed: {error_msg}"
 
-    print("✅ MCP backend structure and behavior verified!")
+    logger.info("✅ MCP backend structure and behavior verified!")
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_mcp_datetime_debug(valid_calendar_entries):
     """
     Debug test to isolate the datetime conversion issue in MCP workflow.
     """
-    print("\n" + "=" * 50)
-    print("Testing MCP Datetime Conversion Debug")
-    print("=" * 50)
-
-    print(f"\n📅 Calendar entries debug:")
-    for i, entry in enumerate(valid_calendar_entries):
-        print(f"  {i+1}. {entry['summary']}:")
-        print(
-            f"     start_datetime: {entry.get('start_datetime')} (type: {type(entry.get('start_datetime'))})"
-        )
-        print(
-            f"     end_datetime: {entry.get('end_datetime')} (type: {type(entry.get('end_datetime'))})"
-        )
+    logger.debug("\n" + "=" * 50)
+    logger.debug("Testing MCP Datetime Conversion Debug")
+    logger.debug("=" * 50)
+
+    print_calendar_entries(valid_calendar_entries, "Calendar entries debug")
 
     # Generate MCP data and check the DataFrame structure
     user_message = "Simple test task"
 
+    # Collect intermediate results as-is; they're only formatted on failure or debug
+    diag: Dict[str, Any] = {}
+
     try:
         # Generate data with calculated schedule length
-        required_days = calculate_required_schedule_days(
+        diag["required_days"] = calculate_required_schedule_days(
             valid_calendar_entries, buffer_days=10
         )
-        print(f"📊 Using {required_days} total schedule days")
 
         initial_df = await generate_mcp_data_helper(
-            valid_calendar_entries, user_message, days_in_schedule=required_days
+            valid_calendar_entries,
+            user_message,
+            days_in_schedule=diag["required_days"],
         )
+        diag["dtypes"] = initial_df.dtypes
+        diag["start_sample"] = initial_df["Start"].head(3)
 
-        print(f"\n📊 Generated DataFrame columns: {list(initial_df.columns)}")
-        print(f"📊 DataFrame shape: {initial_df.shape}")
-        print(f"📊 DataFrame dtypes:\n{initial_df.dtypes}")
-
-        # Check the Start and End column formats
-        print(f"\n🕒 Start column sample:")
-        for i, row in initial_df.head(3).iterrows():
-            start_val = row.get("Start")
-            print(f"  Row {i}: {start_val} (type: {type(start_val)})")
-
-        # Test conversion to JSON and back
-        json_str = initial_df.to_json(orient="split")
-        print(f"\n📄 JSON conversion successful")
-
-        # Test parsing back
-        task_df_back = pd.read_json(StringIO(json_str), orient="split")
-        print(f"📄 JSON parsing back successful")
-        print(f"📄 Parsed dtypes:\n{task_df_back.dtypes}")
-
-        # Test task conversion with minimal error handling
-        print(f"\n🔄 Testing task conversion...")
+        # Test serialization round-trip (pickle preserves datetime dtypes)
+        task_df_back = pickle.loads(
+            pickle.dumps(initial_df, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+        diag["round_trip_dtypes"] = task_df_back.dtypes
 
         # Only try with the first task to isolate issues
         single_task_df = task_df_back.head(1)
-        print(f"Single task for testing:\n{single_task_df}")
+        diag["single_task"] = single_task_df
 
         tasks = DataService.convert_dataframe_to_tasks(single_task_df)
-        print(f"✅ Successfully converted {len(tasks)} tasks")
-
-        for task in tasks:
-            print(f"  Task: {task.description}")
-            print(f"    start_slot: {task.start_slot} (type: {type(task.start_slot)})")
-            print(f"    pinned: {task.pinned}")
-            print(f"    project_id: {task.project_id}")
+        diag["tasks"] = tasks
 
     except Exception as e:
-        print(f"❌ Error in MCP data generation/conversion: {e}")
-        traceback.print_exc()
-        raise
-
-    print("🎯 MCP datetime debug test completed!")
+        pytest.fail(f"MCP datetime debug failed: {e!r}\nDiagnostics: {diag}")
+
+    assert len(tasks) == len(single_task_df), f"Task conversion mismatch: {diag}"
+
+    for key, value in diag.items():
+        logger.debug("%s:\n%s", key, value)
+
+    logger.info("🎯 MCP datetime debug test completed!")
+
+
+def test_compare_datetime_series_matches_scalar():
+    """The vectorised comparison should agree with compare_datetime_values."""
+    cases = [
+        # Same instant in different offsets
+        ("2025-06-02T15:00:00+01:00", "2025-06-02T14:00:00+00:00"),
+        # Same wall-clock time, different instants
+        ("2025-06-02T15:00:00+01:00", "2025-06-02T15:00:00+00:00"),
+        # Aware vs naive compares wall-clock times
+        ("2025-06-02T15:00:00+01:00", "2025-06-02T15:00:00"),
+        ("2025-06-02T15:00:00", "2025-06-02T14:00:00+00:00"),
+        # Naive vs naive, within and outside the tolerance
+        ("2025-06-02T15:00:00", "2025-06-02T15:00:30"),
+        ("2025-06-02T15:00:00", "2025-06-02T16:00:00"),
+        # Unparseable values never match
+        ("not a date", "2025-06-02T15:00:00"),
+    ]
+
+    for first, second in cases:
+        expected = compare_datetime_values(first, second)
+        actual = compare_datetime_series(pd.Series([first]), pd.Series([second]))
+
+        assert actual.tolist() == [
+            expected
+        ], f"Series and scalar comparison disagree for {first!r} vs {second!r}"
 
 
 if __name__ == "__main__":
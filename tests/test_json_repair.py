@@ -1,4 +1,6 @@
 import sys, json
+import orjson
+import pytest
 
 # Add src to path to import our modules
 sys.path.insert(0, "src")
@@ -13,16 +15,35 @@ from ui.pages.chat import safe_json_dumps
 logger = get_test_logger(__name__)
 
 
-def test_actual_streaming_error():
-    """Test the JSON repair functionality with the actual streaming error pattern"""
-    logger.start_test("Testing JSON repair functionality with actual streaming error")
+# Real streaming corruption: the arguments restart mid-way through the calendar data
+STREAMING_DUPLICATE_JSON = """{"task_description":"create ec2 on aws","calendar_file_content":"QkVHSU46VkNBTEVOREFSClZFUlNJT046Mi4wClBST0RJRDotLy9pY2FsLm1hcnVkb3QuY29tLy9pQ2FsIEV2ZW50IE1ha2VyCkNBTFNDQUxFOkdSRUdPUklBTgpCRUdJTjpWVElNRVpPTkUKVFpJRDpBZnJpY2EvTGFnb3MKTEFTVC1NT0RJRklFRDoyMDI0MDQyMlQwNTM0NTBaClRaVVJMOmh0dHBzOi8vd3d3LnR6dXJsLm9yZy96b25laW5mby1vdXRsb29rL0FmcmljYS9MYWdvcwpYLUxJQy1MT0NBVElPTjpBZnJpY2EvTGFnb3MKQkVHSU46U1RBTkRBUkQKVFpOQU1FOldBVApUWk9GRlNFVEZST006KzAxMDAKVFpPRkZTRVRUTzorMDEwMApEVFNUQVJUOjE5NzAwMTAxVDAwMDAwMApFTkQ6U1RBTkRBUkQKRU5EOlZUSU1FWk9ORQpCRUdJTjpWRVZFTlQKRFRTVEFNUDoyMDI1MDYyMFQxMzQxMjBaClVJRDpyZWN1ci1tZWV0aW5nLTJAbW9jawpEVFNUQVJUO1RaSUQ9QWZyaWNhL0xhZ29zOjIwMjUwNjAyVDE1MDAwMApEVEVORDtUWklEPUFmcmljYS9MYWdvczoyMDI1MDYwMlQxNjAwMDAKU1VNTUFSWTpQcm9qZWN0IFJldmlldwpFTkQ6VkVWRU5UCkJFR0lOO"{"task_description":"create ec2 on aws","calendar_file_content":"QkVHSU46VkNBTEVOREFSClZFUlNJT046Mi4wClBST0RJRDotLy9pY2FsLm1hcnVkb3QuY29tLy9pQ2FsIEV2ZW50IE1ha2VyCkNBTFNDQUxFOkdSRUdPUklBTgpCRUdJTjpWVElNRVpPTkUKVFpJRDpBZnJpY2EvTGFnb3MKTEFTVC1NT0RJRklFRDoyMDI0MDQyMlQwNTM0NTBaClRaVVJMOmh0dHBzOi8vd3d3LnR6dXJsLm9yZy96b25laW5mby1vdXRsb29rL0FmcmljYS9MYWdvcwpYLUxJQy1MT0NBVElPTjpBZnJpY2EvTGFnb3MKQkVHSU46U1RBTkRBUkQKVFpOQU1FOldBVApUWk9GRlNFVEZST006KzAxMDAKVFpPRkZTRVRUTzorMDEwMApEVFNUQVJUOjE5NzAwMTAxVDAwMDAwMApFTkQ6U1RBTkRBUkQKRU5EOlZUSU1FWk9ORQpCRUdJTjpWRVZFTlQKRFRTVEFNUDoyMDI1MDYyMFQxMzQxMjBaClVJRDpyZWN1ci1tZWV0aW5nLTFAbW9jawpEVFNUQVJUO1RaSUQ9QWZyaWNhL0xhZ29zOjIwMjUwNjAzVDEwMDAwMApEVEVORDtUWklEPUFmcmljYS9MYWdvczoyMDI1MDYwM1QxMTAwMDAKU1VNTUFSWTpUZWFtIFN5bmMKRU5EOlZFVkVOVApCRUdJTjpWRVZFTlQKRFRTVEFNUDoyMDI1MDYyMFQxMzQxMjBaClVJRDpzaW5nbGUtZXZlbnQtMUBtb2NrCkRUU1RBUlQ7VFpJRD1BZnJpY2EvTGFnb3M6MjAyNTA2MDVUMTQwMDAwCkRURU5EO1RaSUQ9QWZyaWNhL0xhZ29zOjIwMjUwNjA1VDE1MDAwMApTVU1NQVJZOkNsaWVudCBDYWxsCkVORDpWRVZFTlQKQkVHSU46VkVWRU5UCkRUU1RBTVA6MjAyNTA2MjBUMTM0MTIwWgpVSUQ6c2luZ2xlLWV2ZW50LTRAbW9jawpEVFNUQVJUO1RaSUQ9QWZyaWNhL0xhZ29zOjIwMjUwNjE2VDE2MDAwMApEVEVORDtUWklEPUFmcmljYS9MYWdvczoyMDI1MDYxNlQxNzAwMDAKU1VNTUFSWTpXb3Jrc2hvcApFTkQ6VkVWRU5UCkJFR0lOOlZFVkVOVApEVFNUQU1QOjIwMjUwNjIwVDEzNDEyMFoKVUlEOnNpbmdsZS1ldmVudC0zQG1vY2sKRFRTVEFSVDtUWklEPUFmcmljYS9MYWdvczoyMDI1MDcwN1QxMTAwMDAKRFRFTkQ7VFpJRD1BZnJpY2EvTGFnb3M6MjAyNTA3MDdUMTIwMDAwClNVTU1BUlk6UGxhbm5pbmcgU2Vzc2lvbgpFTkQ6VkVWRU5UCkJFR0lOOlZFVkVOVApEVFNUQU1QOjIwMjUwNjIwVDEzNDEyMFoKVUlEOnNpbmdsZS1ldmVudC01QG1vY2sKRFRTVEFSVDtUWklEPUFmcmljYS9MYWdvczoyMDI1MDcyMlQwOTAwMDAKRFRFTkQ7VFpJRD1BZnJpY2EvTGFnb3M6MjAyNTA3MjJUMTAwMDAwClNVTU1BUlk6RGVtbwpFTkQ6VkVWRU5UCkVORDpWQ0FMRU5EQVI="}"""
 
-    broken_json = """{"task_description":"create ec2 on aws","calendar_file_content":"QkVHSU46VkNBTEVOREFSClZFUlNJT046Mi4wClBST0RJRDotLy9pY2FsLm1hcnVkb3QuY29tLy9pQ2FsIEV2ZW50IE1ha2VyCkNBTFNDQUxFOkdSRUdPUklBTgpCRUdJTjpWVElNRVpPTkUKVFpJRDpBZnJpY2EvTGFnb3MKTEFTVC1NT0RJRklFRDoyMDI0MDQyMlQwNTM0NTBaClRaVVJMOmh0dHBzOi8vd3d3LnR6dXJsLm9yZy96b25laW5mby1vdXRsb29rL0FmcmljYS9MYWdvcwpYLUxJQy1MT0NBVElPTjpBZnJpY2EvTGFnb3MKQkVHSU46U1RBTkRBUkQKVFpOQU1FOldBVApUWk9GRlNFVEZST006KzAxMDAKVFpPRkZTRVRUTzorMDEwMApEVFNUQVJUOjE5NzAwMTAxVDAwMDAwMApFTkQ6U1RBTkRBUkQKRU5EOlZUSU1FWk9ORQpCRUdJTjpWRVZFTlQKRFRTVEFNUDoyMDI1MDYyMFQxMzQxMjBaClVJRDpyZWN1ci1tZWV0aW5nLTJAbW9jawpEVFNUQVJUO1RaSUQ9QWZyaWNhL0xhZ29zOjIwMjUwNjAyVDE1MDAwMApEVEVORDtUWklEPUFmcmljYS9MYWdvczoyMDI1MDYwMlQxNjAwMDAKU1VNTUFSWTpQcm9qZWN0IFJldmlldwpFTkQ6VkVWRU5UCkJFR0lOO"{"task_description":"create ec2 on aws","calendar_file_content":"QkVHSU46VkNBTEVOREFSClZFUlNJT046Mi4wClBST0RJRDotLy9pY2FsLm1hcnVkb3QuY29tLy9pQ2FsIEV2ZW50IE1ha2VyCkNBTFNDQUxFOkdSRUdPUklBTgpCRUdJTjpWVElNRVpPTkUKVFpJRDpBZnJpY2EvTGFnb3MKTEFTVC1NT0RJRklFRDoyMDI0MDQyMlQwNTM0NTBaClRaVVJMOmh0dHBzOi8vd3d3LnR6dXJsLm9yZy96b25laW5mby1vdXRsb29rL0FmcmljYS9MYWdvcwpYLUxJQy1MT0NBVElPTjpBZnJpY2EvTGFnb3MKQkVHSU46U1RBTkRBUkQKVFpOQU1FOldBVApUWk9GRlNFVEZST006KzAxMDAKVFpPRkZTRVRUTzorMDEwMApEVFNUQVJUOjE5NzAwMTAxVDAwMDAwMApFTkQ6U1RBTkRBUkQKRU5EOlZUSU1FWk9ORQpCRUdJTjpWRVZFTlQKRFRTVEFNUDoyMDI1MDYyMFQxMzQxMjBaClVJRDpyZWN1ci1tZWV0aW5nLTFAbW9jawpEVFNUQVJUO1RaSUQ9QWZyaWNhL0xhZ29zOjIwMjUwNjAzVDEwMDAwMApEVEVORDtUWklEPUFmcmljYS9MYWdvczoyMDI1MDYwM1QxMTAwMDAKU1VNTUFSWTpUZWFtIFN5bmMKRU5EOlZFVkVOVApCRUdJTjpWRVZFTlQKRFRTVEFNUDoyMDI1MDYyMFQxMzQxMjBaClVJRDpzaW5nbGUtZXZlbnQtMUBtb2NrCkRUU1RBUlQ7VFpJRD1BZnJpY2EvTGFnb3M6MjAyNTA2MDVUMTQwMDAwCkRURU5EO1RaSUQ9QWZyaWNhL0xhZ29zOjIwMjUwNjA1VDE1MDAwMApTVU1NQVJZOkNsaWVudCBDYWxsCkVORDpWRVZFTlQKQkVHSU46VkVWRU5UCkRUU1RBTVA6MjAyNTA2MjBUMTM0MTIwWgpVSUQ6c2luZ2xlLWV2ZW50LTRAbW9jawpEVFNUQVJUO1RaSUQ9QWZyaWNhL0xhZ29zOjIwMjUwNjE2VDE2MDAwMApEVEVORDtUWklEPUFmcmljYS9MYWdvczoyMDI1MDYxNlQxNzAwMDAKU1VNTUFSWTpXb3Jrc2hvcApFTkQ6VkVWRU5UCkJFR0lOOlZFVkVOVApEVFNUQU1QOjIwMjUwNjIwVDEzNDEyMFoKVUlEOnNpbmdsZS1ldmVudC0zQG1vY2sKRFRTVEFSVDtUWklEPUFmcmljYS9MYWdvczoyMDI1MDcwN1QxMTAwMDAKRFRFTkQ7VFpJRD1BZnJpY2EvTGFnb3M6MjAyNTA3MDdUMTIwMDAwClNVTU1BUlk6UGxhbm5pbmcgU2Vzc2lvbgpFTkQ6VkVWRU5UCkJFR0lOOlZFVkVOVApEVFNUQU1QOjIwMjUwNjIwVDEzNDEyMFoKVUlEOnNpbmdsZS1ldmVudC01QG1vY2sKRFRTVEFSVDtUWklEPUFmcmljYS9MYWdvczoyMDI1MDcyMlQwOTAwMDAKRFRFTkQ7VFpJRD1BZnJpY2EvTGFnb3M6MjAyNTA3MjJUMTAwMDAwClNVTU1BUlk6RGVtbwpFTkQ6VkVWRU5UCkVORDpWQ0FMRU5EQVI="}"""
-    logger.debug(f"Broken JSON length: {len(broken_json)}")
+# Simple truncation: the closing brace never arrived
+MISSING_BRACE_JSON = (
+    '{"task_description":"test task","calendar_file_content":"base64data"'
+)
 
-    # Find the error position (where the duplicate starts)
-    error_pos = broken_json.find(';"{"task_description"')
-    logger.debug(f"Error position (duplicate JSON start): {error_pos}")
+# Real-world log corruption: the whole object was emitted twice
+CONCATENATED_DUPLICATE_JSON = (
+    '{"task_description":"foo","calendar_file_content":"abc123"}'
+    '{"task_description":"foo","calendar_file_content":"abc123"}'
+)
+
+
+@pytest.mark.parametrize(
+    "broken_json, expected_task",
+    [
+        (STREAMING_DUPLICATE_JSON, "create ec2 on aws"),
+        (MISSING_BRACE_JSON, "test task"),
+        (CONCATENATED_DUPLICATE_JSON, "foo"),
+    ],
+    ids=["streaming_duplicate", "missing_brace", "concatenated_duplicate"],
+)
+def test_corrupted_json_repair(broken_json, expected_task):
+    """Test that corrupted tool call arguments are repaired into valid JSON"""
+    logger.start_test(f"Testing JSON repair of corrupted arguments ({expected_task})")
+
+    logger.debug("Broken JSON length: %d", len(broken_json))
 
     # Try to parse the broken JSON first to confirm it fails
     json_parse_failed = False
@@ -34,7 +55,10 @@ def test_actual_streaming_error():
     except json.JSONDecodeError as e:
         json_parse_failed = True
         logger.info(f"✅ Expected JSON error at position {e.pos}: {e}")
-        logger.debug(f"Error context: '{broken_json[max(0, e.pos-20):e.pos+20]}'")
+
+        logger.debug(
+            "Error context: '%s'", broken_json[max(0, e.pos - 20) : e.pos + 20]
+        )
 
     assert json_parse_failed, "Expected broken JSON to fail parsing"
 
@@ -45,55 +69,26 @@ def test_actual_streaming_error():
     assert repaired_json is not None, "Repair should return a result"
 
     logger.info(f"✅ Repair attempted, result length: {len(repaired_json)}")
-    logger.debug(f"Repaired preview: {repaired_json[:200]}...")
 
-    # Try to parse the repaired JSON
-    parsed = json.loads(repaired_json)
+    logger.debug("Repaired preview: %s...", repaired_json[:200])
 
-    logger.debug(f"Task description: {parsed.get('task_description', 'MISSING')}")
-    logger.debug(
-        f"Calendar content length: {len(parsed.get('calendar_file_content', ''))}"
-    )
+    # Try to parse the repaired JSON
+    parsed = orjson.loads(repaired_json)
 
     # Verify expected fields exist
     assert "task_description" in parsed, "Repaired JSON should have task_description"
 
-    assert (
-        "calendar_file_content" in parsed
-    ), "Repaired JSON should have calendar_file_content"
+    assert isinstance(
+        parsed.get("calendar_file_content"), str
+    ), "Repaired JSON should have a calendar_file_content string"
 
     assert (
-        parsed["task_description"] == "create ec2 on aws"
+        parsed["task_description"] == expected_task
     ), "Task description should match expected value"
 
     logger.pass_test("Repaired JSON parses correctly")
 
 
-def test_simpler_corruption():
-    """Test a simpler case of JSON corruption for baseline functionality"""
-    logger.start_test("Testing simpler JSON corruption")
-
-    # Missing closing brace
-    simple_broken = (
-        '{"task_description":"test task","calendar_file_content":"base64data"'
-    )
-
-    assembler = ToolCallAssembler()
-    repaired = assembler._attempt_json_repair(simple_broken)
-
-    assert repaired is not None, "Simple repair should return a result"
-
-    # Try to parse the repaired JSON
-    parsed = json.loads(repaired)
-
-    assert (
-        "task_description" in parsed
-    ), "Simple repair should preserve task_description"
-
-    assert parsed["task_description"] == "test task", "Task description should match"
-    logger.pass_test("Simple repair works correctly")
-
-
 def test_datetime_serialization():
     """Test our datetime serialization fixes"""
     logger.start_test("Testing datetime serialization")
@@ -110,7 +105,8 @@ def test_datetime_serialization():
     }
 
     result = safe_json_dumps(test_data, indent=2)
-    logger.debug(f"Sample output: {result[:200]}...")
+
+    logger.debug("Sample output: %s...", result[:200])
 
     # Verify it's valid JSON
     parsed_back = json.loads(result)
@@ -122,6 +118,36 @@ def test_datetime_serialization():
     logger.pass_test("Datetime serialization works correctly")
 
 
+def test_safe_json_dumps_output_format():
+    """Pin the orjson output format of safe_json_dumps"""
+    logger.start_test("Testing safe_json_dumps output format")
+
+    from enum import Enum
+
+    class Status(Enum):
+        DONE = "done"
+
+    data = {
+        "task": "Café",
+        "status": Status.DONE,
+        "score": float("nan"),
+        "start": datetime(2025, 6, 23, 10, 0),
+        1: [1, 2],
+    }
+
+    assert safe_json_dumps(data) == (
+        '{"task":"Café","status":"done","score":null,'
+        '"start":"2025-06-23T10:00:00","1":[1,2]}'
+    ), "Compact output should use orjson formatting"
+
+    assert safe_json_dumps({"a": [1]}, indent=2) == '{\n  "a": [\n    1\n  ]\n}'
+
+    # Other keyword arguments keep the json.dumps format
+    assert safe_json_dumps({"a": "é"}, sort_keys=True) == '{"a": "\\u00e9"}'
+
+    logger.pass_test("safe_json_dumps output format is stable")
+
+
 def test_gradio_format():
     """Test that user_message returns the correct Gradio message format."""
     logger.start_test("Testing Gradio message format via user_message")
@@ -173,7 +199,7 @@ def test_non_printable_character_removal():
     assert (
         "\x00" not in repaired and "\x01" not in repaired and "\x02" not in repaired
     ), "Non-printable characters should be removed"
-    parsed = json.loads(repaired)
+    parsed = orjson.loads(repaired)
     assert parsed["task_description"] == "ok"
     logger.pass_test("Non-printable characters removed correctly")
 
@@ -184,7 +210,7 @@ def test_fallback_extract_first_valid_json():
     broken = 'garbage before {"task_description":"ok","calendar_file_content":"abc"} garbage after'
     assembler = ToolCallAssembler()
     repaired = assembler._attempt_json_repair(broken)
-    parsed = json.loads(repaired)
+    parsed = orjson.loads(repaired)
     assert parsed["task_description"] == "ok"
     logger.pass_test("Fallback extraction of first valid JSON works")
 
@@ -199,21 +225,6 @@ def test_unrecoverable_json_returns_none():
     logger.pass_test("Unrecoverable JSON returns None as expected")
 
 
-def test_realworld_corrupted_json():
-    """Test repair on a real-world log corruption example (duplicate JSON, partial base64)."""
-    logger.start_test("Testing real-world corrupted JSON repair")
-    broken = (
-        '{"task_description":"foo","calendar_file_content":"abc123"}'
-        '{"task_description":"foo","calendar_file_content":"abc123"}'
-    )
-    assembler = ToolCallAssembler()
-    repaired = assembler._attempt_json_repair(broken)
-    assert repaired is not None, "Should repair real-world duplicate JSON corruption"
-    parsed = json.loads(repaired)
-    assert parsed["task_description"] == "foo"
-    logger.pass_test("Real-world duplicate JSON repair works")
-
-
 def test_idempotency():
     """Test that repairing already-repaired JSON is idempotent (no change)."""
     logger.start_test("Testing idempotency of JSON repair")
@@ -15,6 +15,15 @@ load_secrets("tests/secrets/creds.py")
 from src.factory.agents.task_composer_agent import TaskComposerAgent
 
 
+def _duration_units(duration) -> int:
+    """Coerce an estimated duration to whole units, counting unparseable values as 0."""
+    try:
+        return int(duration)
+
+    except (TypeError, ValueError):
+        return 0
+
+
 @pytest.mark.asyncio
 async def test_task_composer_agent():
     """Test the task composer agent workflow"""
@@ -39,10 +48,7 @@ async def test_task_composer_agent():
         logger.debug(f"- {task}: {duration} units (Skill: {skill})")
 
     # Calculate total time
-    total_time = sum(
-        int(time) if str(time).isdigit() and str(time) != "" else 0
-        for _, time, _ in result
-    )
+    total_time = sum(_duration_units(time) for _, time, _ in result)
     logger.info(f"Total estimated time: {total_time} units ({total_time * 30} minutes)")
 
     # Verify the result is a list of 3-tuples
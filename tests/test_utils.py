@@ -24,7 +24,8 @@ Environment Variables:
 
 import os
 import sys
-from typing import Optional, Dict, Any
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List
 
 # Add src to path to import our modules (for tests that use this utility)
 if "src" not in [p.split("/")[-1] for p in sys.path]:
@@ -44,6 +45,9 @@ class TestLogger:
     methods for test lifecycle events.
     """
 
+    # Snapshot of YUGA_DEBUG so debug() can return before entering logging
+    _debug_on = is_debug_enabled()
+
     def __init__(self, name: str):
         """
         Initialize test logger for a specific test module.
@@ -79,21 +83,27 @@ class TestLogger:
         """Mark a test as skipped with reason."""
         self.logger.warning(f"⏭️ SKIPPED: {reason}")
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args: Any) -> None:
         """Log an info message."""
-        self.logger.info(message)
+        self.logger.info(message, *args)
 
-    def debug(self, message: str) -> None:
-        """Log a debug message (only shown when YUGA_DEBUG=true)."""
-        self.logger.debug(message)
+    def debug(self, message: str, *args: Any) -> None:
+        """
+        Log a debug message (only shown when YUGA_DEBUG=true).
 
-    def warning(self, message: str) -> None:
+        Pass values as %-style args so they are only formatted when debug
+        logging is enabled.
+        """
+        if self._debug_on:
+            self.logger.debug(message, *args)
+
+    def warning(self, message: str, *args: Any) -> None:
         """Log a warning message."""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: Any) -> None:
         """Log an error message."""
-        self.logger.error(message)
+        self.logger.error(message, *args)
 
     def section(self, title: str) -> None:
         """Log a section header for organizing test output."""
@@ -108,6 +118,15 @@ class TestLogger:
         self.logger.info("-" * 40)
 
 
+@dataclass(slots=True)
+class _TestRecord:
+    """A single tracked test outcome."""
+
+    name: str
+    passed: bool
+    details: Optional[str] = None
+
+
 class TestResults:
     """
     Track and report test results consistently across test files.
@@ -117,14 +136,23 @@ class TestResults:
 
     def __init__(self, logger: TestLogger):
         self.logger = logger
-        self.results: Dict[str, bool] = {}
-        self.details: Dict[str, str] = {}
+        self.records: List[_TestRecord] = []
+
+    @property
+    def results(self) -> Dict[str, bool]:
+        """Pass/fail status keyed by test name."""
+        return {record.name: record.passed for record in self.records}
+
+    @property
+    def details(self) -> Dict[str, str]:
+        """Failure details keyed by test name, for results that recorded any."""
+        return {
+            record.name: record.details for record in self.records if record.details
+        }
 
     def add_result(self, test_name: str, passed: bool, details: str = None) -> None:
         """Add a test result."""
-        self.results[test_name] = passed
-        if details:
-            self.details[test_name] = details
+        self.records.append(_TestRecord(test_name, passed, details))
 
         status = "✅ PASS" if passed else "❌ FAIL"
         self.logger.info(f"  {test_name.replace('_', ' ').title()}: {status}")
@@ -158,8 +186,8 @@ class TestResults:
         Returns:
             bool: True if all tests passed, False otherwise
         """
-        total_tests = len(self.results)
-        passed_tests = sum(1 for passed in self.results.values() if passed)
+        total_tests = len(self.records)
+        passed_tests = sum(record.passed for record in self.records)
 
         self.logger.section("Test Results Summary")
         self.logger.info(f"📊 Tests Run: {total_tests}")
@@ -167,15 +195,15 @@ class TestResults:
         self.logger.info(f"❌ Failed: {total_tests - passed_tests}")
 
         # Log individual results
-        for test_name, passed in self.results.items():
-            status = "✅ PASS" if passed else "❌ FAIL"
-            self.logger.info(f"  {test_name.replace('_', ' ').title()}: {status}")
+        for record in self.records:
+            status = "✅ PASS" if record.passed else "❌ FAIL"
+            self.logger.info(f"  {record.name.replace('_', ' ').title()}: {status}")
 
             # Show failure details if available
-            if not passed and test_name in self.details:
-                self.logger.debug(f"    Error: {self.details[test_name]}")
+            if not record.passed and record.details:
+                self.logger.debug("    Error: %s", record.details)
 
-        all_passed = all(self.results.values())
+        all_passed = passed_tests == total_tests
         if all_passed:
             self.logger.info("🎉 ALL TESTS PASSED!")
         else:
@@ -186,9 +214,9 @@ class TestResults:
 
 # Global test configuration
 test_config = {
-    "debug_enabled": is_debug_enabled(),
+    "debug_enabled": TestLogger._debug_on,
     "pytest_running": "PYTEST_CURRENT_TEST" in os.environ,
-    "log_level": "DEBUG" if is_debug_enabled() else "INFO",
+    "log_level": "DEBUG" if TestLogger._debug_on else "INFO",
 }
 
 # Convenience functions for quick access